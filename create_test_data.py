@@ -1,5 +1,6 @@
 """Create test data for SubTUI."""
 
+import argparse
 import uuid
 from datetime import datetime, timedelta
 
@@ -17,157 +18,117 @@ from sub_tui.models import (
 )
 
 
-def create_test_data():
-    """Create sample data for testing."""
+# (name, code, type, description, created days ago, reviewed days ago)
+SUBJECT_SEEDS = [
+    ("Engineering Team", "ENG", SubjectType.TEAM, "Software engineering team", 30, 2),
+    ("Product Roadmap", "PRD", SubjectType.BOARD, "Product planning and roadmap", 60, 5),
+    ("John Doe", None, SubjectType.PERSON, "Senior Developer", 90, 1),
+]
+
+# (subject index, title, description, status, due in days, created days ago, tags)
+ACTION_SEEDS = [
+    (0, "Review pull request #123", "Code review for authentication feature",
+     ActionStatus.TODO, 0, 1, ["code-review", "urgent"]),  # Today
+    (0, "Fix bug in login flow", "Users cannot login with email",
+     ActionStatus.IN_PROGRESS, -1, 3, ["bug", "urgent"]),  # Overdue
+    (0, "Update dependencies", "Update npm packages to latest versions",
+     ActionStatus.TODO, 3, 5, ["maintenance"]),  # This week
+    (0, "Write unit tests", "Add tests for payment module",
+     ActionStatus.TODO, 10, 2, ["testing"]),  # Next week
+    (1, "Prepare Q1 roadmap presentation", None,
+     ActionStatus.TODO, 1, 7, ["presentation"]),  # This week
+    (1, "Gather user feedback", None,
+     ActionStatus.IN_PROGRESS, 5, 10, ["research", "ux"]),  # This week
+]
+
+# (title, priority, created days ago, recurrence pattern)
+AGENDA_SEEDS = [
+    ("Sprint retrospective topics", 8, 5, RecurrencePattern.WEEKLY),
+    ("Discuss new architecture proposal", 9, 3, None),
+    ("Code review process improvements", 5, 10, None),
+]
+
+
+def create_test_data(force: bool = False):
+    """Create sample data for testing.
+
+    Does nothing if the database already holds subjects, unless force is set.
+    """
     db = Database()
-
-    # Create test subjects
-    subjects = [
-        Subject(
-            id=str(uuid.uuid4()),
-            name="Engineering Team",
-            code="ENG",
-            type=SubjectType.TEAM,
-            description="Software engineering team",
-            created_at=datetime.now() - timedelta(days=30),
-            last_reviewed_at=datetime.now() - timedelta(days=2),
-        ),
-        Subject(
-            id=str(uuid.uuid4()),
-            name="Product Roadmap",
-            code="PRD",
-            type=SubjectType.BOARD,
-            description="Product planning and roadmap",
-            created_at=datetime.now() - timedelta(days=60),
-            last_reviewed_at=datetime.now() - timedelta(days=5),
-        ),
-        Subject(
-            id=str(uuid.uuid4()),
-            name="John Doe",
-            type=SubjectType.PERSON,
-            description="Senior Developer",
-            created_at=datetime.now() - timedelta(days=90),
-            last_reviewed_at=datetime.now() - timedelta(days=1),
-        ),
-    ]
-
-    for subject in subjects:
-        db.add_subject(subject)
-
-    # Create actions for Engineering Team
-    eng_subject = subjects[0]
-    actions = [
-        Action(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Review pull request #123",
-            description="Code review for authentication feature",
-            status=ActionStatus.TODO,
-            due_date=datetime.now(),  # Today
-            created_at=datetime.now() - timedelta(days=1),
-            tags=["code-review", "urgent"],
-        ),
-        Action(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Fix bug in login flow",
-            description="Users cannot login with email",
-            status=ActionStatus.IN_PROGRESS,
-            due_date=datetime.now() - timedelta(days=1),  # Overdue
-            created_at=datetime.now() - timedelta(days=3),
-            tags=["bug", "urgent"],
-        ),
-        Action(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Update dependencies",
-            description="Update npm packages to latest versions",
-            status=ActionStatus.TODO,
-            due_date=datetime.now() + timedelta(days=3),  # This week
-            created_at=datetime.now() - timedelta(days=5),
-            tags=["maintenance"],
-        ),
-        Action(
-            id=str(uuid.uuid4()),
+    if not force and db.conn.execute("SELECT 1 FROM subjects LIMIT 1").fetchone():
+        db.close()
+        print("Database already has data, skipping (use --force to seed anyway)")
+        return
+
+    now = datetime.now()
+
+    # Mint every ID up front (seeded rows plus 1 meeting and 1 note)
+    # instead of once per constructor call
+    id_count = len(SUBJECT_SEEDS) + len(ACTION_SEEDS) + len(AGENDA_SEEDS) + 2
+    ids = iter([str(uuid.uuid4()) for _ in range(id_count)])
+
+    # Indexes are rebuilt once after seeding rather than per inserted row, and
+    # the whole seed commits once (or not at all if any insert fails)
+    with db.bulk_load(), db.transaction():
+        # Create test subjects
+        subjects = [
+            Subject(
+                id=next(ids),
+                name=name,
+                code=code,
+                type=subject_type,
+                description=description,
+                created_at=now - timedelta(days=created),
+                last_reviewed_at=now - timedelta(days=reviewed),
+            )
+            for name, code, subject_type, description, created, reviewed in SUBJECT_SEEDS
+        ]
+
+        db.add_many_subjects(subjects)
+
+        # Create actions for Engineering Team and Product Roadmap
+        actions = [
+            Action(
+                id=next(ids),
+                subject_id=subjects[subject_index].id,
+                title=title,
+                description=description,
+                status=status,
+                due_date=now + timedelta(days=due),
+                created_at=now - timedelta(days=created),
+                tags=tags,
+            )
+            for subject_index, title, description, status, due, created, tags in ACTION_SEEDS
+        ]
+
+        db.add_many_actions(actions)
+
+        # Create agenda items for Engineering Team
+        eng_subject = subjects[0]
+        agenda_items = [
+            AgendaItem(
+                id=next(ids),
+                subject_id=eng_subject.id,
+                title=title,
+                priority=priority,
+                status=AgendaStatus.ACTIVE,
+                created_at=now - timedelta(days=created),
+                is_recurring=recurrence is not None,
+                recurrence_pattern=recurrence,
+            )
+            for title, priority, created, recurrence in AGENDA_SEEDS
+        ]
+
+        db.add_many_agenda_items(agenda_items)
+
+        # Create a meeting
+        meeting = Meeting(
+            id=next(ids),
             subject_id=eng_subject.id,
-            title="Write unit tests",
-            description="Add tests for payment module",
-            status=ActionStatus.TODO,
-            due_date=datetime.now() + timedelta(days=10),  # Next week
-            created_at=datetime.now() - timedelta(days=2),
-            tags=["testing"],
-        ),
-    ]
-
-    for action in actions:
-        db.add_action(action)
-
-    # Create actions for Product Roadmap
-    prd_subject = subjects[1]
-    prd_actions = [
-        Action(
-            id=str(uuid.uuid4()),
-            subject_id=prd_subject.id,
-            title="Prepare Q1 roadmap presentation",
-            status=ActionStatus.TODO,
-            due_date=datetime.now() + timedelta(days=1),  # This week
-            created_at=datetime.now() - timedelta(days=7),
-            tags=["presentation"],
-        ),
-        Action(
-            id=str(uuid.uuid4()),
-            subject_id=prd_subject.id,
-            title="Gather user feedback",
-            status=ActionStatus.IN_PROGRESS,
-            due_date=datetime.now() + timedelta(days=5),  # This week
-            created_at=datetime.now() - timedelta(days=10),
-            tags=["research", "ux"],
-        ),
-    ]
-
-    for action in prd_actions:
-        db.add_action(action)
-
-    # Create agenda items for Engineering Team
-    agenda_items = [
-        AgendaItem(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Sprint retrospective topics",
-            priority=8,
-            status=AgendaStatus.ACTIVE,
-            created_at=datetime.now() - timedelta(days=5),
-            is_recurring=True,
-            recurrence_pattern=RecurrencePattern.WEEKLY,
-        ),
-        AgendaItem(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Discuss new architecture proposal",
-            priority=9,
-            status=AgendaStatus.ACTIVE,
-            created_at=datetime.now() - timedelta(days=3),
-        ),
-        AgendaItem(
-            id=str(uuid.uuid4()),
-            subject_id=eng_subject.id,
-            title="Code review process improvements",
-            priority=5,
-            status=AgendaStatus.ACTIVE,
-            created_at=datetime.now() - timedelta(days=10),
-        ),
-    ]
-
-    for item in agenda_items:
-        db.add_agenda_item(item)
-
-    # Create a meeting
-    meeting = Meeting(
-        id=str(uuid.uuid4()),
-        subject_id=eng_subject.id,
-        date=datetime.now() - timedelta(days=7),
-        attendees=["Alice", "Bob", "Charlie"],
-        content="""## Sprint Planning
+            title="Sprint Planning",
+            date=now - timedelta(days=7),
+            attendees=["Alice", "Bob", "Charlie"],
+            content="""## Sprint Planning
 
 ### My Agenda Items
 
@@ -183,18 +144,18 @@ def create_test_data():
 - **Decision**: Investigate GitHub Actions
 - **Action**: Bob to create POC
 """,
-        created_at=datetime.now() - timedelta(days=7),
-        updated_at=datetime.now() - timedelta(days=7),
-    )
+            created_at=now - timedelta(days=7),
+            updated_at=now - timedelta(days=7),
+        )
 
-    db.add_meeting(meeting)
+        db.add_meeting(meeting)
 
-    # Create a note
-    note = Note(
-        id=str(uuid.uuid4()),
-        subject_id=eng_subject.id,
-        title="Team Guidelines",
-        content="""# Engineering Team Guidelines
+        # Create a note
+        note = Note(
+            id=next(ids),
+            subject_id=eng_subject.id,
+            title="Team Guidelines",
+            content="""# Engineering Team Guidelines
 
 ## Code Review Process
 
@@ -208,21 +169,23 @@ def create_test_data():
 - Email for important announcements
 - Weekly team meeting on Mondays
 """,
-        tags=["guidelines", "onboarding"],
-        created_at=datetime.now() - timedelta(days=20),
-        updated_at=datetime.now() - timedelta(days=15),
-    )
+            tags=["guidelines", "onboarding"],
+            created_at=now - timedelta(days=20),
+            updated_at=now - timedelta(days=15),
+        )
 
-    db.add_note(note)
+        db.add_note(note)
 
     db.close()
 
     print("✅ Test data created successfully!")
     print(f"Created {len(subjects)} subjects")
-    print(f"Created {len(actions) + len(prd_actions)} actions")
+    print(f"Created {len(actions)} actions")
     print(f"Created {len(agenda_items)} agenda items")
     print("Created 1 meeting and 1 note")
 
 
 if __name__ == "__main__":
-    create_test_data()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--force", action="store_true", help="seed even if the database has data")
+    create_test_data(force=parser.parse_args().force)
@@ -1,12 +1,503 @@
 """SQLite database for storing and querying all application data."""
 
 import json
-import sqlite3
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Optional
-
-from .models import Action, AgendaItem, Meeting, Note, Subject
+from typing import Iterator, Optional
+
+try:
+    # pysqlite3-binary is a drop-in build of the sqlite3 module bundling a
+    # current SQLite, for Pythons linked against an old system library
+    from pysqlite3 import dbapi2 as sqlite3
+except ImportError:
+    import sqlite3
+
+from .models import Action, AgendaItem, Meeting, Note, Subject, SubjectBundle
+
+# SQLite builds older than 3.32 cap a statement at 999 bound parameters
+_MAX_SQL_PARAMS = 999
+
+_SUBJECT_COLUMNS = ("id", "name", "code", "type", "description", "created_at", "last_reviewed_at")
+_AGENDA_ITEM_COLUMNS = (
+    "id", "subject_id", "title", "description", "priority", "status", "created_at",
+    "discussed_at", "is_recurring", "recurrence_pattern",
+)
+_ACTION_COLUMNS = (
+    "id", "subject_id", "title", "description", "status", "due_date", "created_at",
+    "completed_at", "archived_at", "meeting_id", "note_id", "agenda_item_id", "tags",
+)
+_MEETING_COLUMNS = (
+    "id", "subject_id", "title", "date", "attendees", "content", "created_at", "updated_at",
+)
+_NOTE_COLUMNS = ("id", "subject_id", "title", "content", "tags", "created_at", "updated_at")
+
+
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build a single-row INSERT statement for the given columns."""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+def _select_sql(table: str, columns: tuple[str, ...], clause: str) -> str:
+    """Build a SELECT of the given columns, in order, so rows unpack positionally."""
+    return f"SELECT {', '.join(columns)} FROM {table} {clause}"
+
+
+# CRUD statements are built once so every call passes sqlite3 the same SQL
+# text and hits its per-connection statement cache instead of re-preparing
+_INSERT_SUBJECT_SQL = _insert_sql("subjects", _SUBJECT_COLUMNS)
+_INSERT_AGENDA_ITEM_SQL = _insert_sql("agenda_items", _AGENDA_ITEM_COLUMNS)
+_INSERT_MEETING_SQL = _insert_sql("meetings", _MEETING_COLUMNS)
+_INSERT_ACTION_SQL = _insert_sql("actions", _ACTION_COLUMNS)
+_INSERT_NOTE_SQL = _insert_sql("notes", _NOTE_COLUMNS)
+
+_SELECT_SUBJECT_SQL = _select_sql("subjects", _SUBJECT_COLUMNS, "WHERE id = ?")
+_SELECT_ALL_SUBJECTS_SQL = _select_sql("subjects", _SUBJECT_COLUMNS, "ORDER BY last_reviewed_at DESC")
+_UPDATE_SUBJECT_SQL = """UPDATE subjects
+    SET name = ?, code = ?, type = ?, description = ?,
+        created_at = ?, last_reviewed_at = ?
+    WHERE id = ?"""
+# Child rows go with it through ON DELETE CASCADE
+_DELETE_SUBJECT_SQL = "DELETE FROM subjects WHERE id = ?"
+
+_SELECT_AGENDA_ITEM_SQL = _select_sql("agenda_items", _AGENDA_ITEM_COLUMNS, "WHERE id = ?")
+_SELECT_AGENDA_ITEMS_SQL = _select_sql(
+    "agenda_items", _AGENDA_ITEM_COLUMNS, "WHERE subject_id = ? ORDER BY priority DESC"
+)
+_SELECT_UNARCHIVED_AGENDA_ITEMS_SQL = _select_sql(
+    "agenda_items", _AGENDA_ITEM_COLUMNS, "WHERE subject_id = ? AND status != 'archived' ORDER BY priority DESC"
+)
+_UPDATE_AGENDA_ITEM_SQL = """UPDATE agenda_items
+    SET title = ?, description = ?, priority = ?, status = ?,
+        discussed_at = ?, is_recurring = ?, recurrence_pattern = ?
+    WHERE id = ?"""
+_DELETE_AGENDA_ITEM_SQL = "DELETE FROM agenda_items WHERE id = ?"
+_COUNT_ACTIVE_AGENDA_ITEMS_SQL = (
+    "SELECT subject_id, COUNT(*) FROM agenda_items WHERE status = 'active' GROUP BY subject_id"
+)
+
+_SELECT_MEETING_SQL = _select_sql("meetings", _MEETING_COLUMNS, "WHERE id = ?")
+_SELECT_MEETINGS_SQL = _select_sql("meetings", _MEETING_COLUMNS, "WHERE subject_id = ? ORDER BY date DESC")
+_UPDATE_MEETING_SQL = """UPDATE meetings
+    SET title = ?, date = ?, attendees = ?, content = ?, updated_at = ?
+    WHERE id = ?"""
+_DELETE_MEETING_SQL = "DELETE FROM meetings WHERE id = ?"
+_SELECT_MEETINGS_BY_ATTENDEE_SQL = _select_sql(
+    "meetings m JOIN meeting_attendees a ON a.meeting_id = m.id",
+    tuple(f"m.{column}" for column in _MEETING_COLUMNS),
+    "WHERE a.name = ? ORDER BY m.date DESC",
+)
+_INSERT_MEETING_ATTENDEE_SQL = "INSERT OR IGNORE INTO meeting_attendees (meeting_id, name) VALUES (?, ?)"
+_DELETE_MEETING_ATTENDEES_SQL = "DELETE FROM meeting_attendees WHERE meeting_id = ?"
+
+_SELECT_ACTION_SQL = _select_sql("actions", _ACTION_COLUMNS, "WHERE id = ?")
+_SELECT_ACTIONS_SQL = _select_sql("actions", _ACTION_COLUMNS, "WHERE subject_id = ? ORDER BY due_date ASC")
+_SELECT_UNARCHIVED_ACTIONS_SQL = _select_sql(
+    "actions", _ACTION_COLUMNS, "WHERE subject_id = ? AND archived_at IS NULL ORDER BY due_date ASC"
+)
+_SELECT_ACTIONS_BY_MEETING_SQL = _select_sql(
+    "actions", _ACTION_COLUMNS, "WHERE meeting_id = ? AND archived_at IS NULL ORDER BY created_at DESC"
+)
+_SELECT_ACTIONS_BY_NOTE_SQL = _select_sql(
+    "actions", _ACTION_COLUMNS, "WHERE note_id = ? AND archived_at IS NULL ORDER BY created_at DESC"
+)
+_UPDATE_ACTION_SQL = """UPDATE actions
+    SET title = ?, description = ?, status = ?, due_date = ?,
+        completed_at = ?, archived_at = ?, meeting_id = ?, note_id = ?,
+        agenda_item_id = ?, tags = ?
+    WHERE id = ?"""
+_DELETE_ACTION_SQL = "DELETE FROM actions WHERE id = ?"
+_COUNT_ACTIONS_SQL = "SELECT subject_id, COUNT(*) FROM actions GROUP BY subject_id"
+_COUNT_UNARCHIVED_ACTIONS_SQL = (
+    "SELECT subject_id, COUNT(*) FROM actions WHERE archived_at IS NULL GROUP BY subject_id"
+)
+_SELECT_ACTIONS_BY_TAG_SQL = _select_sql(
+    "actions a JOIN tags t ON t.entity_type = 'action' AND t.entity_id = a.id",
+    tuple(f"a.{column}" for column in _ACTION_COLUMNS),
+    "WHERE t.tag = ? ORDER BY a.due_date ASC",
+)
+
+_SELECT_NOTE_SQL = _select_sql("notes", _NOTE_COLUMNS, "WHERE id = ?")
+_SELECT_NOTES_SQL = _select_sql("notes", _NOTE_COLUMNS, "WHERE subject_id = ? ORDER BY updated_at DESC")
+_UPDATE_NOTE_SQL = """UPDATE notes
+    SET title = ?, content = ?, tags = ?, updated_at = ?
+    WHERE id = ?"""
+_DELETE_NOTE_SQL = "DELETE FROM notes WHERE id = ?"
+_SELECT_NOTES_BY_TAG_SQL = _select_sql(
+    "notes n JOIN tags t ON t.entity_type = 'note' AND t.entity_id = n.id",
+    tuple(f"n.{column}" for column in _NOTE_COLUMNS),
+    "WHERE t.tag = ? ORDER BY n.updated_at DESC",
+)
+
+_INSERT_TAG_SQL = "INSERT OR IGNORE INTO tags (entity_type, entity_id, tag) VALUES (?, ?, ?)"
+_DELETE_TAGS_SQL = "DELETE FROM tags WHERE entity_type = ? AND entity_id = ?"
+
+
+# Due date filters for get_actions_by_timeframe. Bounds are ISO timestamps from
+# _timeframe_params(), so the comparisons are plain range scans on the
+# due_date index rather than a date() call per row.
+_DUE_DATE_FILTERS = {
+    "today": "due_date >= :today AND due_date < :tomorrow",
+    "week": "due_date >= :today AND due_date < :week_end",
+    "next_week": "due_date >= :week_end AND due_date < :next_week_end",
+}
+
+
+def _timeframe_sql(timeframe: str, include_archived: bool) -> str:
+    """Build the get_actions_by_timeframe query for one timeframe/archive combination."""
+    conditions = []
+    if not include_archived:
+        conditions.append("archived_at IS NULL")
+    if timeframe in _DUE_DATE_FILTERS:
+        conditions.append(_DUE_DATE_FILTERS[timeframe])
+    elif timeframe == "all" and not include_archived:
+        # Open actions plus those completed in the last week
+        conditions.append("(status != 'done' OR completed_at >= :week_ago)")
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return f"""SELECT a.*, s.name as subject_name,
+            (a.due_date < :today AND a.status != 'done') AS overdue
+        FROM actions a
+        JOIN subjects s ON a.subject_id = s.id
+        WHERE {where_clause}
+        ORDER BY
+            CASE WHEN due_date IS NULL THEN 1 ELSE 0 END,
+            due_date ASC"""
+
+
+def _timeframe_params(now: datetime) -> dict:
+    """Get the day boundaries that the timeframe queries compare against."""
+    today = datetime.combine(now.date(), time())
+    return {
+        "today": today.isoformat(),
+        "tomorrow": (today + timedelta(days=1)).isoformat(),
+        "week_end": (today + timedelta(days=8)).isoformat(),
+        "next_week_end": (today + timedelta(days=15)).isoformat(),
+        "week_ago": (today - timedelta(days=7)).isoformat(),
+    }
+
+
+# Every timeframe query is built once so repeated dashboard refreshes reuse
+# the same prepared statement
+_TIMEFRAME_SQL = {
+    (timeframe, include_archived): _timeframe_sql(timeframe, include_archived)
+    for timeframe in (*_DUE_DATE_FILTERS, "all")
+    for include_archived in (False, True)
+}
+
+# Number of the last migration in Database._run_migrations; bump it when
+# adding one so existing databases run it on their next open
+_SCHEMA_VERSION = 6
+
+# Table DDL by name, also used by _rebuild_tables() when a migration changes
+# a table definition SQLite cannot ALTER in place
+_TABLES = {
+    "subjects": """
+        CREATE TABLE IF NOT EXISTS subjects (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            code TEXT,
+            type TEXT NOT NULL,
+            description TEXT,
+            created_at TEXT NOT NULL,
+            last_reviewed_at TEXT NOT NULL
+        )
+    """,
+    "agenda_items": """
+        CREATE TABLE IF NOT EXISTS agenda_items (
+            id TEXT PRIMARY KEY,
+            subject_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            priority INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            discussed_at TEXT,
+            is_recurring INTEGER NOT NULL,
+            recurrence_pattern TEXT,
+            FOREIGN KEY (subject_id) REFERENCES subjects(id) ON DELETE CASCADE
+        )
+    """,
+    "meetings": """
+        CREATE TABLE IF NOT EXISTS meetings (
+            id TEXT PRIMARY KEY,
+            subject_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            date TEXT NOT NULL,
+            attendees TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY (subject_id) REFERENCES subjects(id) ON DELETE CASCADE
+        )
+    """,
+    "actions": """
+        CREATE TABLE IF NOT EXISTS actions (
+            id TEXT PRIMARY KEY,
+            subject_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            status TEXT NOT NULL,
+            due_date TEXT,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            archived_at TEXT,
+            meeting_id TEXT,
+            note_id TEXT,
+            agenda_item_id TEXT,
+            tags TEXT,
+            FOREIGN KEY (subject_id) REFERENCES subjects(id) ON DELETE CASCADE
+        )
+    """,
+    # One row per attendee so meetings can be looked up by person; the
+    # meetings.attendees column keeps the ordered, comma-separated display list
+    "meeting_attendees": """
+        CREATE TABLE IF NOT EXISTS meeting_attendees (
+            meeting_id TEXT NOT NULL,
+            name TEXT NOT NULL COLLATE NOCASE,
+            PRIMARY KEY (meeting_id, name),
+            FOREIGN KEY (meeting_id) REFERENCES meetings(id) ON DELETE CASCADE
+        )
+    """,
+    # One row per action/note tag so items can be looked up by tag; the tags
+    # column on actions and notes keeps the comma-separated display list
+    "tags": """
+        CREATE TABLE IF NOT EXISTS tags (
+            entity_type TEXT NOT NULL,  -- 'action' or 'note'
+            entity_id TEXT NOT NULL,
+            tag TEXT NOT NULL COLLATE NOCASE,
+            PRIMARY KEY (entity_type, entity_id, tag)
+        )
+    """,
+    "notes": """
+        CREATE TABLE IF NOT EXISTS notes (
+            id TEXT PRIMARY KEY,
+            subject_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            tags TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY (subject_id) REFERENCES subjects(id) ON DELETE CASCADE
+        )
+    """,
+}
+
+
+# Secondary indexes by name, kept apart from the table DDL so bulk_load()
+# can drop them and rebuild each one in a single pass after seeding
+_INDEXES = {
+    "idx_subjects_name": "CREATE INDEX IF NOT EXISTS idx_subjects_name ON subjects(name)",
+    "idx_subjects_type": "CREATE INDEX IF NOT EXISTS idx_subjects_type ON subjects(type)",
+    # Per-subject indexes include the column each list is ordered by, so
+    # get_agenda_items/get_meetings/get_actions/get_notes read rows in order
+    # instead of sorting them
+    "idx_agenda_subject": "CREATE INDEX IF NOT EXISTS idx_agenda_subject ON agenda_items(subject_id, priority)",
+    "idx_agenda_status": "CREATE INDEX IF NOT EXISTS idx_agenda_status ON agenda_items(status)",
+    "idx_meetings_subject": "CREATE INDEX IF NOT EXISTS idx_meetings_subject ON meetings(subject_id, date)",
+    "idx_meetings_date": "CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(date)",
+    "idx_actions_subject": "CREATE INDEX IF NOT EXISTS idx_actions_subject ON actions(subject_id, due_date)",
+    "idx_actions_status": "CREATE INDEX IF NOT EXISTS idx_actions_status ON actions(status)",
+    "idx_actions_due_date": "CREATE INDEX IF NOT EXISTS idx_actions_due_date ON actions(due_date)",
+    # Partial indexes for the dashboard timeframe queries, which skip archived
+    # actions and recently completed ones
+    "idx_actions_active_due": (
+        "CREATE INDEX IF NOT EXISTS idx_actions_active_due ON actions(due_date, status, subject_id) "
+        "WHERE archived_at IS NULL"
+    ),
+    "idx_actions_completed": (
+        "CREATE INDEX IF NOT EXISTS idx_actions_completed ON actions(completed_at) WHERE status = 'done'"
+    ),
+    "idx_notes_subject": "CREATE INDEX IF NOT EXISTS idx_notes_subject ON notes(subject_id, updated_at)",
+    "idx_tags_tag": "CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag, entity_type)",
+    "idx_meeting_attendees_name": (
+        "CREATE INDEX IF NOT EXISTS idx_meeting_attendees_name ON meeting_attendees(name)"
+    ),
+}
+
+
+# Tags rows are keyed by entity type rather than a foreign key, so deletes
+# are propagated by trigger
+_TAG_TRIGGERS = {
+    "actions_tags_delete": """CREATE TRIGGER IF NOT EXISTS actions_tags_delete AFTER DELETE ON actions BEGIN
+    DELETE FROM tags WHERE entity_type = 'action' AND entity_id = old.id;
+END""",
+    "notes_tags_delete": """CREATE TRIGGER IF NOT EXISTS notes_tags_delete AFTER DELETE ON notes BEGIN
+    DELETE FROM tags WHERE entity_type = 'note' AND entity_id = old.id;
+END""",
+}
+
+
+# Unified full-text search across all content types. Only the display and
+# search columns are tokenized; the identifiers are stored but not indexed.
+_FTS_TABLE_SQL = """CREATE VIRTUAL TABLE IF NOT EXISTS unified_fts USING fts5(
+    content_type UNINDEXED,  -- 'subject', 'agenda', 'meeting', 'action', 'note'
+    content_id UNINDEXED,    -- ID of the entity
+    subject_id UNINDEXED,    -- Subject ID (NULL for subjects themselves)
+    subject_name,            -- Subject name for display
+    title,                   -- Title/name for display in results
+    searchable_text,         -- Combined searchable content
+    tokenize='porter unicode61 remove_diacritics 2'
+)"""
+
+# Persistent rank function for unified_fts: bm25 weighted per column, with
+# title matches counting most, then subject name, then body text
+_FTS_RANK = "bm25(0.0, 0.0, 0.0, 5.0, 10.0, 1.0)"
+
+# Maps each indexed entity to its unified_fts rowid, so the triggers can
+# update and delete FTS rows by rowid instead of scanning the FTS table
+_FTS_MAP_SQL = """CREATE TABLE IF NOT EXISTS fts_map (
+    fts_rowid INTEGER PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    content_id TEXT NOT NULL,
+    UNIQUE (content_type, content_id)
+)"""
+
+# Triggers that keep unified_fts and fts_map in sync with the base tables, by name
+_FTS_TRIGGERS = {
+    # FTS triggers for subjects
+    "subjects_fts_insert": """CREATE TRIGGER IF NOT EXISTS subjects_fts_insert AFTER INSERT ON subjects BEGIN
+    INSERT INTO fts_map(content_type, content_id) VALUES ('subject', new.id);
+    INSERT INTO unified_fts(rowid, content_type, content_id, subject_id, subject_name, title, searchable_text)
+    VALUES (last_insert_rowid(), 'subject', new.id, NULL, new.name, new.name,
+            new.name || ' ' || COALESCE(new.code, '') || ' ' || COALESCE(new.description, ''));
+END""",
+    "subjects_fts_delete": """CREATE TRIGGER IF NOT EXISTS subjects_fts_delete AFTER DELETE ON subjects BEGIN
+    DELETE FROM unified_fts WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'subject' AND content_id = old.id
+    );
+    DELETE FROM fts_map WHERE content_type = 'subject' AND content_id = old.id;
+END""",
+    "subjects_fts_update": """CREATE TRIGGER IF NOT EXISTS subjects_fts_update AFTER UPDATE ON subjects BEGIN
+    UPDATE unified_fts
+    SET subject_name = new.name,
+        title = new.name,
+        searchable_text = new.name || ' ' || COALESCE(new.code, '') || ' ' || COALESCE(new.description, '')
+    WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'subject' AND content_id = old.id
+    );
+END""",
+    # FTS triggers for agenda items
+    "agenda_fts_insert": """CREATE TRIGGER IF NOT EXISTS agenda_fts_insert AFTER INSERT ON agenda_items BEGIN
+    INSERT INTO fts_map(content_type, content_id) VALUES ('agenda', new.id);
+    INSERT INTO unified_fts(rowid, content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT last_insert_rowid(), 'agenda', new.id, new.subject_id, s.name, new.title,
+           new.title || ' ' || COALESCE(new.description, '')
+    FROM subjects s WHERE s.id = new.subject_id;
+END""",
+    "agenda_fts_delete": """CREATE TRIGGER IF NOT EXISTS agenda_fts_delete AFTER DELETE ON agenda_items BEGIN
+    DELETE FROM unified_fts WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'agenda' AND content_id = old.id
+    );
+    DELETE FROM fts_map WHERE content_type = 'agenda' AND content_id = old.id;
+END""",
+    "agenda_fts_update": """CREATE TRIGGER IF NOT EXISTS agenda_fts_update AFTER UPDATE ON agenda_items BEGIN
+    UPDATE unified_fts
+    SET subject_id = new.subject_id,
+        subject_name = (SELECT name FROM subjects WHERE id = new.subject_id),
+        title = new.title,
+        searchable_text = new.title || ' ' || COALESCE(new.description, '')
+    WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'agenda' AND content_id = old.id
+    );
+END""",
+    # FTS triggers for meetings
+    "meetings_fts_insert": """CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+    INSERT INTO fts_map(content_type, content_id) VALUES ('meeting', new.id);
+    INSERT INTO unified_fts(rowid, content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT last_insert_rowid(), 'meeting', new.id, new.subject_id, s.name, 'Meeting ' || date(new.date),
+           'Meeting ' || new.attendees || ' ' || new.content
+    FROM subjects s WHERE s.id = new.subject_id;
+END""",
+    "meetings_fts_delete": """CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+    DELETE FROM unified_fts WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'meeting' AND content_id = old.id
+    );
+    DELETE FROM fts_map WHERE content_type = 'meeting' AND content_id = old.id;
+END""",
+    "meetings_fts_update": """CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE ON meetings BEGIN
+    UPDATE unified_fts
+    SET subject_id = new.subject_id,
+        subject_name = (SELECT name FROM subjects WHERE id = new.subject_id),
+        title = 'Meeting ' || date(new.date),
+        searchable_text = 'Meeting ' || new.attendees || ' ' || new.content
+    WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'meeting' AND content_id = old.id
+    );
+END""",
+    # FTS triggers for actions
+    "actions_fts_insert": """CREATE TRIGGER IF NOT EXISTS actions_fts_insert AFTER INSERT ON actions BEGIN
+    INSERT INTO fts_map(content_type, content_id) VALUES ('action', new.id);
+    INSERT INTO unified_fts(rowid, content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT last_insert_rowid(), 'action', new.id, new.subject_id, s.name, new.title,
+           new.title || ' ' || COALESCE(new.description, '') || ' ' || COALESCE(new.tags, '')
+    FROM subjects s WHERE s.id = new.subject_id;
+END""",
+    "actions_fts_delete": """CREATE TRIGGER IF NOT EXISTS actions_fts_delete AFTER DELETE ON actions BEGIN
+    DELETE FROM unified_fts WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'action' AND content_id = old.id
+    );
+    DELETE FROM fts_map WHERE content_type = 'action' AND content_id = old.id;
+END""",
+    "actions_fts_update": """CREATE TRIGGER IF NOT EXISTS actions_fts_update AFTER UPDATE ON actions BEGIN
+    UPDATE unified_fts
+    SET subject_id = new.subject_id,
+        subject_name = (SELECT name FROM subjects WHERE id = new.subject_id),
+        title = new.title,
+        searchable_text = new.title || ' ' || COALESCE(new.description, '') || ' ' || COALESCE(new.tags, '')
+    WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'action' AND content_id = old.id
+    );
+END""",
+    # FTS triggers for notes
+    "notes_fts_insert": """CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+    INSERT INTO fts_map(content_type, content_id) VALUES ('note', new.id);
+    INSERT INTO unified_fts(rowid, content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT last_insert_rowid(), 'note', new.id, new.subject_id, s.name, new.title,
+           new.title || ' ' || new.content || ' ' || COALESCE(new.tags, '')
+    FROM subjects s WHERE s.id = new.subject_id;
+END""",
+    "notes_fts_delete": """CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    DELETE FROM unified_fts WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'note' AND content_id = old.id
+    );
+    DELETE FROM fts_map WHERE content_type = 'note' AND content_id = old.id;
+END""",
+    "notes_fts_update": """CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE ON notes BEGIN
+    UPDATE unified_fts
+    SET subject_id = new.subject_id,
+        subject_name = (SELECT name FROM subjects WHERE id = new.subject_id),
+        title = new.title,
+        searchable_text = new.title || ' ' || new.content || ' ' || COALESCE(new.tags, '')
+    WHERE rowid = (
+        SELECT fts_rowid FROM fts_map WHERE content_type = 'note' AND content_id = old.id
+    );
+END""",
+}
+
+# Repopulate unified_fts from the base tables, mirroring the insert triggers
+_FTS_REBUILD_SQL = (
+    """INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT 'subject', id, NULL, name, name,
+           name || ' ' || COALESCE(code, '') || ' ' || COALESCE(description, '')
+    FROM subjects""",
+    """INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT 'agenda', a.id, a.subject_id, s.name, a.title,
+           a.title || ' ' || COALESCE(a.description, '')
+    FROM agenda_items a JOIN subjects s ON s.id = a.subject_id""",
+    """INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT 'meeting', m.id, m.subject_id, s.name, 'Meeting ' || date(m.date),
+           'Meeting ' || m.attendees || ' ' || m.content
+    FROM meetings m JOIN subjects s ON s.id = m.subject_id""",
+    """INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT 'action', a.id, a.subject_id, s.name, a.title,
+           a.title || ' ' || COALESCE(a.description, '') || ' ' || COALESCE(a.tags, '')
+    FROM actions a JOIN subjects s ON s.id = a.subject_id""",
+    """INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
+    SELECT 'note', n.id, n.subject_id, s.name, n.title,
+           n.title || ' ' || n.content || ' ' || COALESCE(n.tags, '')
+    FROM notes n JOIN subjects s ON s.id = n.subject_id""",
+)
 
 
 class Database:
@@ -16,6 +507,7 @@ class Database:
         """Initialize database connection."""
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self._tx_depth = 0
         self._init_db()
 
     def _init_db(self) -> None:
@@ -23,264 +515,319 @@ class Database:
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit mode: single statements commit on their own and the
+        # driver does not scan each statement to open implicit transactions;
+        # multi-statement writes go through transaction()
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
-
-        # Create tables
-        self.conn.executescript("""
-            -- Subjects table
-            CREATE TABLE IF NOT EXISTS subjects (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                code TEXT,
-                type TEXT NOT NULL,
-                description TEXT,
-                created_at TEXT NOT NULL,
-                last_reviewed_at TEXT NOT NULL
-            );
-
-            -- Agenda items table
-            CREATE TABLE IF NOT EXISTS agenda_items (
-                id TEXT PRIMARY KEY,
-                subject_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                priority INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                discussed_at TEXT,
-                is_recurring INTEGER NOT NULL,
-                recurrence_pattern TEXT,
-                FOREIGN KEY (subject_id) REFERENCES subjects(id)
-            );
-
-            -- Meetings table
-            CREATE TABLE IF NOT EXISTS meetings (
-                id TEXT PRIMARY KEY,
-                subject_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                date TEXT NOT NULL,
-                attendees TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (subject_id) REFERENCES subjects(id)
-            );
-
-            -- Actions table
-            CREATE TABLE IF NOT EXISTS actions (
-                id TEXT PRIMARY KEY,
-                subject_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                status TEXT NOT NULL,
-                due_date TEXT,
-                created_at TEXT NOT NULL,
-                completed_at TEXT,
-                archived_at TEXT,
-                meeting_id TEXT,
-                agenda_item_id TEXT,
-                tags TEXT,
-                FOREIGN KEY (subject_id) REFERENCES subjects(id)
-            );
-
-            -- Notes table
-            CREATE TABLE IF NOT EXISTS notes (
-                id TEXT PRIMARY KEY,
-                subject_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                tags TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (subject_id) REFERENCES subjects(id)
-            );
-
-            -- Create indexes
-            CREATE INDEX IF NOT EXISTS idx_subjects_name ON subjects(name);
-            CREATE INDEX IF NOT EXISTS idx_subjects_type ON subjects(type);
-            CREATE INDEX IF NOT EXISTS idx_agenda_subject ON agenda_items(subject_id);
-            CREATE INDEX IF NOT EXISTS idx_agenda_status ON agenda_items(status);
-            CREATE INDEX IF NOT EXISTS idx_meetings_subject ON meetings(subject_id);
-            CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(date);
-            CREATE INDEX IF NOT EXISTS idx_actions_subject ON actions(subject_id);
-            CREATE INDEX IF NOT EXISTS idx_actions_status ON actions(status);
-            CREATE INDEX IF NOT EXISTS idx_actions_due_date ON actions(due_date);
-            CREATE INDEX IF NOT EXISTS idx_notes_subject ON notes(subject_id);
-
-            -- Unified full-text search across all content types
-            CREATE VIRTUAL TABLE IF NOT EXISTS unified_fts USING fts5(
-                content_type,     -- 'subject', 'agenda', 'meeting', 'action', 'note'
-                content_id,       -- ID of the entity
-                subject_id,       -- Subject ID (NULL for subjects themselves)
-                subject_name,     -- Subject name for display
-                title,            -- Title/name for display in results
-                searchable_text,  -- Combined searchable content
-                tokenize='porter unicode61'
-            );
-
-            -- FTS triggers for subjects
-            CREATE TRIGGER IF NOT EXISTS subjects_fts_insert AFTER INSERT ON subjects BEGIN
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                VALUES ('subject', new.id, NULL, new.name, new.name,
-                        new.name || ' ' || COALESCE(new.code, '') || ' ' || COALESCE(new.description, ''));
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS subjects_fts_delete AFTER DELETE ON subjects BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'subject' AND content_id = old.id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS subjects_fts_update AFTER UPDATE ON subjects BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'subject' AND content_id = old.id;
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                VALUES ('subject', new.id, NULL, new.name, new.name,
-                        new.name || ' ' || COALESCE(new.code, '') || ' ' || COALESCE(new.description, ''));
-            END;
-
-            -- FTS triggers for agenda items
-            CREATE TRIGGER IF NOT EXISTS agenda_fts_insert AFTER INSERT ON agenda_items BEGIN
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'agenda', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || COALESCE(new.description, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS agenda_fts_delete AFTER DELETE ON agenda_items BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'agenda' AND content_id = old.id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS agenda_fts_update AFTER UPDATE ON agenda_items BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'agenda' AND content_id = old.id;
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'agenda', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || COALESCE(new.description, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            -- FTS triggers for meetings
-            CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'meeting', new.id, new.subject_id, s.name, 'Meeting ' || date(new.date),
-                       'Meeting ' || new.attendees || ' ' || new.content
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'meeting' AND content_id = old.id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE ON meetings BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'meeting' AND content_id = old.id;
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'meeting', new.id, new.subject_id, s.name, 'Meeting ' || date(new.date),
-                       'Meeting ' || new.attendees || ' ' || new.content
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            -- FTS triggers for actions
-            CREATE TRIGGER IF NOT EXISTS actions_fts_insert AFTER INSERT ON actions BEGIN
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'action', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || COALESCE(new.description, '') || ' ' || COALESCE(new.tags, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS actions_fts_delete AFTER DELETE ON actions BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'action' AND content_id = old.id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS actions_fts_update AFTER UPDATE ON actions BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'action' AND content_id = old.id;
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'action', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || COALESCE(new.description, '') || ' ' || COALESCE(new.tags, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            -- FTS triggers for notes
-            CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'note', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || new.content || ' ' || COALESCE(new.tags, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'note' AND content_id = old.id;
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE ON notes BEGIN
-                DELETE FROM unified_fts WHERE content_type = 'note' AND content_id = old.id;
-                INSERT INTO unified_fts(content_type, content_id, subject_id, subject_name, title, searchable_text)
-                SELECT 'note', new.id, new.subject_id, s.name, new.title,
-                       new.title || ' ' || new.content || ' ' || COALESCE(new.tags, '')
-                FROM subjects s WHERE s.id = new.subject_id;
-            END;
-        """)
-
-        self.conn.commit()
-
-        # Database migrations
+        self._read_cursor = self.conn.cursor()
+        self._read_cursor.row_factory = None
+
+        # WAL lets commits skip the rollback-journal fsync; NORMAL sync is
+        # still crash safe in WAL mode
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # Wait for a competing writer instead of failing with "database is locked"
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
+        with self.transaction():
+            for table_sql in _TABLES.values():
+                self.conn.execute(table_sql)
+
+        # Database migrations run before indexes and triggers are (re)created,
+        # since rebuilding a table drops both
         self._run_migrations()
 
+        with self.transaction():
+            for index_sql in _INDEXES.values():
+                self.conn.execute(index_sql)
+            for trigger_sql in _TAG_TRIGGERS.values():
+                self.conn.execute(trigger_sql)
+        self._sync_search_schema()
+
     def _run_migrations(self) -> None:
-        """Run database migrations for schema updates."""
+        """Run database migrations for schema updates.
+
+        Each migration checks whether it is still needed. Once all have run,
+        PRAGMA user_version records it so later opens skip the checks.
+        """
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+
         # Migration 1: Add title column to meetings table
         cursor = self.conn.execute("PRAGMA table_info(meetings)")
         columns = [row[1] for row in cursor.fetchall()]
         if 'title' not in columns:
             self.conn.execute("ALTER TABLE meetings ADD COLUMN title TEXT DEFAULT 'Meeting'")
-            self.conn.commit()
 
         # Migration 2: Add note_id column to actions table
         cursor = self.conn.execute("PRAGMA table_info(actions)")
         columns = [row[1] for row in cursor.fetchall()]
         if 'note_id' not in columns:
             self.conn.execute("ALTER TABLE actions ADD COLUMN note_id TEXT")
+
+        # Migration 3: Rebuild child tables whose subject FK lacks ON DELETE CASCADE
+        stale = [
+            table for table in ("agenda_items", "meetings", "actions", "notes")
+            if any(fk[6] != "CASCADE" for fk in self.conn.execute(f"PRAGMA foreign_key_list({table})"))
+        ]
+        if stale:
+            self._rebuild_tables(stale)
+
+        # Migration 4: Move JSON-encoded attendee lists to the comma-separated
+        # format and index each attendee in meeting_attendees
+        legacy = []
+        for meeting_id, attendees in self._fetch("SELECT id, attendees FROM meetings WHERE attendees LIKE '[%'"):
+            try:
+                legacy.append((meeting_id, json.loads(attendees)))
+            except ValueError:
+                # Already comma-separated, with a first name that starts with "["
+                continue
+        if legacy:
+            with self.transaction():
+                self.conn.executemany(
+                    "UPDATE meetings SET attendees = ? WHERE id = ?",
+                    [(", ".join(names), meeting_id) for meeting_id, names in legacy]
+                )
+                self.conn.executemany(
+                    _INSERT_MEETING_ATTENDEE_SQL,
+                    [(meeting_id, name) for meeting_id, names in legacy for name in names]
+                )
+
+        # Migration 5: Backfill the tags table from the comma-separated tags columns
+        if not self.conn.execute("SELECT 1 FROM tags LIMIT 1").fetchone():
+            with self.transaction():
+                for entity_type, table in (("action", "actions"), ("note", "notes")):
+                    rows = self._fetch(f"SELECT id, tags FROM {table} WHERE tags IS NOT NULL")
+                    self.conn.executemany(_INSERT_TAG_SQL, [
+                        (entity_type, entity_id, tag.strip())
+                        for entity_id, tags in rows
+                        for tag in tags.split(",") if tag.strip()
+                    ])
+
+        # Migration 6: Drop the single-column per-subject indexes; _init_db
+        # recreates them with the list sort column appended
+        for name in ("idx_agenda_subject", "idx_meetings_subject", "idx_actions_subject", "idx_notes_subject"):
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+        self.conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _sync_search_schema(self) -> None:
+        """Create the FTS table and triggers, replacing any whose definition changed.
+
+        SQLite cannot ALTER a virtual table or trigger, so a changed
+        definition is dropped and recreated, and a recreated FTS table is
+        repopulated from the base tables.
+        """
+        tables = {"unified_fts": _FTS_TABLE_SQL, "fts_map": _FTS_MAP_SQL}
+        expected = {**tables, **_FTS_TRIGGERS}
+        stored = dict(self._read("SELECT name, sql FROM sqlite_master WHERE sql IS NOT NULL"))
+        # sqlite_master keeps the statement text minus IF NOT EXISTS
+        stale = [
+            name for name, sql in expected.items()
+            if name in stored and stored[name] != sql.replace(" IF NOT EXISTS", "", 1)
+        ]
+        with self.transaction():
+            for name in stale:
+                self.conn.execute(f"DROP {'TABLE' if name in tables else 'TRIGGER'} {name}")
+            for sql in expected.values():
+                self.conn.execute(sql)
+            if any(name in stale or name not in stored for name in tables):
+                self.rebuild_search_index()
+            rank = self.conn.execute("SELECT v FROM unified_fts_config WHERE k = 'rank'").fetchone()
+            if not rank or rank[0] != _FTS_RANK:
+                self.conn.execute("INSERT INTO unified_fts(unified_fts, rank) VALUES ('rank', ?)", (_FTS_RANK,))
+
+    def rebuild_search_index(self) -> None:
+        """Repopulate the unified FTS index and its rowid map from the base tables."""
+        with self.transaction():
+            self.conn.execute("DELETE FROM unified_fts")
+            self.conn.execute("DELETE FROM fts_map")
+            for sql in _FTS_REBUILD_SQL:
+                self.conn.execute(sql)
+            self.conn.execute(
+                "INSERT INTO fts_map(fts_rowid, content_type, content_id) "
+                "SELECT rowid, content_type, content_id FROM unified_fts"
+            )
+
+    def _rebuild_tables(self, tables: list[str]) -> None:
+        """Recreate tables from their _TABLES DDL, keeping their rows.
+
+        Dropping the old table also drops its indexes and triggers;
+        _init_db recreates both after migrations have run.
+        """
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self.transaction():
+                for table in tables:
+                    columns = ", ".join(row[1] for row in self.conn.execute(f"PRAGMA table_info({table})"))
+                    self.conn.execute(_TABLES[table].replace(f"IF NOT EXISTS {table} (", f"{table}_new (", 1))
+                    self.conn.execute(f"INSERT INTO {table}_new ({columns}) SELECT {columns} FROM {table}")
+                    self.conn.execute(f"DROP TABLE {table}")
+                    self.conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        finally:
+            self.conn.execute("PRAGMA foreign_keys=ON")
+
+    def _insert_many(self, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        """Insert rows with multi-row VALUES statements in one transaction.
+
+        Rows are chunked so no statement exceeds _MAX_SQL_PARAMS parameters.
+        """
+        if not rows:
+            return
+
+        placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+        chunk_size = max(1, _MAX_SQL_PARAMS // len(columns))
+        with self.transaction():
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                self.conn.execute(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+                    + ", ".join([placeholders] * len(chunk)),
+                    [value for row in chunk for value in row]
+                )
+
+    def _read(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a SELECT on a cursor that yields plain tuples.
+
+        Model getters unpack rows positionally with from_row(), so they skip
+        building a sqlite3.Row and a dict for every row.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+
+    def _fetch(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a SELECT on the shared read cursor and return all rows as tuples.
+
+        By-ID lookups, counts and the lookup lists (by tag, attendee, meeting
+        or note) reuse one cursor instead of allocating one per call. Rows are
+        drained straight away so the statement is finished before the cursor
+        is reused. The iter_* generators, and the per-subject list getters
+        built on them, use _read() instead.
+        """
+        return self._read_cursor.execute(sql, params).fetchall()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several add/update/delete calls into a single transaction.
+
+        The outermost call takes the write lock up front with BEGIN IMMEDIATE
+        and commits on exit; nested calls join it. An exception rolls back
+        everything written since the outermost call was entered. When the
+        caller already opened a transaction on the connection, this joins it
+        and leaves the commit or rollback to the caller.
+        """
+        owns = self._tx_depth == 0 and not self.conn.in_transaction
+        if owns:
+            self.conn.execute("BEGIN IMMEDIATE")
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            if owns:
+                self.conn.rollback()
+            raise
+        self._tx_depth -= 1
+        if owns:
             self.conn.commit()
 
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Seed many rows without per-row index maintenance or FK checks.
+
+        Secondary indexes and the FTS triggers are dropped on entry. On exit
+        the indexes are rebuilt and the search index is refilled in one pass
+        instead of one trigger-driven FTS write per inserted row.
+        """
+        foreign_keys = self.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        with self.transaction():
+            for name in _INDEXES:
+                self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+            for name in _FTS_TRIGGERS:
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        try:
+            yield
+        finally:
+            with self.transaction():
+                for index_sql in _INDEXES.values():
+                    self.conn.execute(index_sql)
+                for trigger_sql in _FTS_TRIGGERS.values():
+                    self.conn.execute(trigger_sql)
+                self.rebuild_search_index()
+            self.conn.execute(f"PRAGMA foreign_keys={foreign_keys}")
+
     # ==================== Subject CRUD ====================
 
+    @staticmethod
+    def _subject_values(subject: Subject) -> tuple:
+        """Get INSERT parameters for a subject."""
+        return (
+            subject.id,
+            subject.name,
+            subject.code,
+            subject.type.value,
+            subject.description,
+            subject.created_at.isoformat(),
+            subject.last_reviewed_at.isoformat(),
+        )
+
     def add_subject(self, subject: Subject) -> None:
         """Add a new subject."""
-        self.conn.execute(
-            """INSERT INTO subjects (id, name, code, type, description, created_at, last_reviewed_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                subject.id,
-                subject.name,
-                subject.code,
-                subject.type.value,
-                subject.description,
-                subject.created_at.isoformat(),
-                subject.last_reviewed_at.isoformat(),
-            )
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_SUBJECT_SQL, self._subject_values(subject))
+
+    def add_many_subjects(self, subjects: list[Subject]) -> None:
+        """Add several subjects in a single transaction."""
+        self._insert_many("subjects", _SUBJECT_COLUMNS, [self._subject_values(s) for s in subjects])
 
     def get_subject(self, subject_id: str) -> Optional[Subject]:
         """Get a subject by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM subjects WHERE id = ?",
-            (subject_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return Subject.from_dict(dict(row))
-        return None
+        rows = self._fetch(_SELECT_SUBJECT_SQL, (subject_id,))
+        return Subject.from_row(rows[0]) if rows else None
+
+    def get_subject_bundle(self, subject_id: str) -> Optional[SubjectBundle]:
+        """Get a subject with its unarchived actions and agenda items, meetings and notes.
+
+        The five reads run in one read transaction, so they all see the same
+        snapshot of the database.
+        """
+        own_tx = not self.conn.in_transaction
+        if own_tx:
+            self.conn.execute("BEGIN")
+        try:
+            rows = self._fetch(_SELECT_SUBJECT_SQL, (subject_id,))
+            if not rows:
+                return None
+            return SubjectBundle(
+                subject=Subject.from_row(rows[0]),
+                actions=self.get_actions(subject_id),
+                agenda_items=self.get_agenda_items(subject_id),
+                meetings=self.get_meetings(subject_id),
+                notes=self.get_notes(subject_id),
+            )
+        finally:
+            if own_tx:
+                self.conn.commit()
+
+    def iter_subjects(self) -> Iterator[Subject]:
+        """Yield all subjects, decoding each row only as it is consumed."""
+        for row in self._read(_SELECT_ALL_SUBJECTS_SQL):
+            yield Subject.from_row(row)
 
     def get_all_subjects(self) -> list[Subject]:
         """Get all subjects."""
-        cursor = self.conn.execute("SELECT * FROM subjects ORDER BY last_reviewed_at DESC")
-        return [Subject.from_dict(dict(row)) for row in cursor.fetchall()]
+        return list(self.iter_subjects())
 
     def update_subject(self, subject: Subject) -> None:
         """Update an existing subject."""
         self.conn.execute(
-            """UPDATE subjects
-               SET name = ?, code = ?, type = ?, description = ?,
-                   created_at = ?, last_reviewed_at = ?
-               WHERE id = ?""",
+            _UPDATE_SUBJECT_SQL,
             (
                 subject.name,
                 subject.code,
@@ -291,67 +838,56 @@ class Database:
                 subject.id,
             )
         )
-        self.conn.commit()
 
     def delete_subject(self, subject_id: str) -> None:
         """Delete a subject and all related data."""
-        # Delete related data first (cascade)
-        self.conn.execute("DELETE FROM agenda_items WHERE subject_id = ?", (subject_id,))
-        self.conn.execute("DELETE FROM meetings WHERE subject_id = ?", (subject_id,))
-        self.conn.execute("DELETE FROM actions WHERE subject_id = ?", (subject_id,))
-        self.conn.execute("DELETE FROM notes WHERE subject_id = ?", (subject_id,))
-        # Delete the subject itself
-        self.conn.execute("DELETE FROM subjects WHERE id = ?", (subject_id,))
-        self.conn.commit()
+        self.conn.execute(_DELETE_SUBJECT_SQL, (subject_id,))
 
     # ==================== Agenda Item CRUD ====================
 
+    @staticmethod
+    def _agenda_item_values(item: AgendaItem) -> tuple:
+        """Get INSERT parameters for an agenda item."""
+        return (
+            item.id,
+            item.subject_id,
+            item.title,
+            item.description,
+            item.priority,
+            item.status.value,
+            item.created_at.isoformat(),
+            item.discussed_at.isoformat() if item.discussed_at else None,
+            1 if item.is_recurring else 0,
+            item.recurrence_pattern.value if item.recurrence_pattern else None,
+        )
+
     def add_agenda_item(self, item: AgendaItem) -> None:
         """Add a new agenda item."""
-        self.conn.execute(
-            """INSERT INTO agenda_items
-               (id, subject_id, title, description, priority, status, created_at,
-                discussed_at, is_recurring, recurrence_pattern)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                item.id,
-                item.subject_id,
-                item.title,
-                item.description,
-                item.priority,
-                item.status.value,
-                item.created_at.isoformat(),
-                item.discussed_at.isoformat() if item.discussed_at else None,
-                1 if item.is_recurring else 0,
-                item.recurrence_pattern.value if item.recurrence_pattern else None,
-            )
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_AGENDA_ITEM_SQL, self._agenda_item_values(item))
 
-    def get_agenda_items(self, subject_id: str) -> list[AgendaItem]:
-        """Get all agenda items for a subject."""
-        cursor = self.conn.execute(
-            "SELECT * FROM agenda_items WHERE subject_id = ? ORDER BY priority DESC",
-            (subject_id,)
-        )
-        return [AgendaItem.from_dict(dict(row)) for row in cursor.fetchall()]
+    def add_many_agenda_items(self, items: list[AgendaItem]) -> None:
+        """Add several agenda items in a single transaction."""
+        self._insert_many("agenda_items", _AGENDA_ITEM_COLUMNS, [self._agenda_item_values(i) for i in items])
+
+    def iter_agenda_items(self, subject_id: str, include_archived: bool = False) -> Iterator[AgendaItem]:
+        """Yield a subject's agenda items (archived ones only if asked), decoding each row as it is consumed."""
+        sql = _SELECT_AGENDA_ITEMS_SQL if include_archived else _SELECT_UNARCHIVED_AGENDA_ITEMS_SQL
+        for row in self._read(sql, (subject_id,)):
+            yield AgendaItem.from_row(row)
+
+    def get_agenda_items(self, subject_id: str, include_archived: bool = False) -> list[AgendaItem]:
+        """Get a subject's agenda items, leaving out archived ones unless asked."""
+        return list(self.iter_agenda_items(subject_id, include_archived))
 
     def get_agenda_item(self, item_id: str) -> Optional[AgendaItem]:
         """Get a single agenda item by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM agenda_items WHERE id = ?",
-            (item_id,)
-        )
-        row = cursor.fetchone()
-        return AgendaItem.from_dict(dict(row)) if row else None
+        rows = self._fetch(_SELECT_AGENDA_ITEM_SQL, (item_id,))
+        return AgendaItem.from_row(rows[0]) if rows else None
 
     def update_agenda_item(self, item: AgendaItem) -> None:
         """Update an existing agenda item."""
         self.conn.execute(
-            """UPDATE agenda_items
-               SET title = ?, description = ?, priority = ?, status = ?,
-                   discussed_at = ?, is_recurring = ?, recurrence_pattern = ?
-               WHERE id = ?""",
+            _UPDATE_AGENDA_ITEM_SQL,
             (
                 item.title,
                 item.description,
@@ -363,263 +899,260 @@ class Database:
                 item.id,
             )
         )
-        self.conn.commit()
+
+    def get_active_agenda_counts_by_subject(self) -> dict[str, int]:
+        """Count active agenda items per subject ID (subjects with none are omitted)."""
+        return dict(self._fetch(_COUNT_ACTIVE_AGENDA_ITEMS_SQL))
 
     def delete_agenda_item(self, item_id: str) -> None:
         """Delete an agenda item."""
-        self.conn.execute("DELETE FROM agenda_items WHERE id = ?", (item_id,))
-        self.conn.commit()
+        self.conn.execute(_DELETE_AGENDA_ITEM_SQL, (item_id,))
 
     # ==================== Meeting CRUD ====================
 
+    @staticmethod
+    def _meeting_values(meeting: Meeting) -> tuple:
+        """Get INSERT parameters for a meeting."""
+        return (
+            meeting.id,
+            meeting.subject_id,
+            meeting.title,
+            meeting.date.isoformat(),
+            ", ".join(meeting.attendees),
+            meeting.content,
+            meeting.created_at.isoformat(),
+            meeting.updated_at.isoformat(),
+        )
+
     def add_meeting(self, meeting: Meeting) -> None:
         """Add a new meeting."""
-        self.conn.execute(
-            """INSERT INTO meetings
-               (id, subject_id, title, date, attendees, content, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                meeting.id,
-                meeting.subject_id,
-                meeting.title,
-                meeting.date.isoformat(),
-                json.dumps(meeting.attendees),
-                meeting.content,
-                meeting.created_at.isoformat(),
-                meeting.updated_at.isoformat(),
-            )
+        with self.transaction():
+            self.conn.execute(_INSERT_MEETING_SQL, self._meeting_values(meeting))
+            self._insert_attendees([meeting])
+
+    def add_many_meetings(self, meetings: list[Meeting]) -> None:
+        """Add several meetings in a single transaction."""
+        with self.transaction():
+            self._insert_many("meetings", _MEETING_COLUMNS, [self._meeting_values(m) for m in meetings])
+            self._insert_attendees(meetings)
+
+    def _insert_tags(self, entity_type: str, items: list) -> None:
+        """Index the tags of the given actions or notes in the tags table."""
+        self.conn.executemany(
+            _INSERT_TAG_SQL,
+            [(entity_type, item.id, tag) for item in items for tag in item.tags]
+        )
+
+    def _insert_attendees(self, meetings: list[Meeting]) -> None:
+        """Index the attendees of the given meetings in meeting_attendees."""
+        self.conn.executemany(
+            _INSERT_MEETING_ATTENDEE_SQL,
+            [(meeting.id, name) for meeting in meetings for name in meeting.attendees]
         )
-        self.conn.commit()
 
     def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
         """Get a meeting by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM meetings WHERE id = ?",
-            (meeting_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return Meeting.from_dict(dict(row))
-        return None
+        rows = self._fetch(_SELECT_MEETING_SQL, (meeting_id,))
+        return Meeting.from_row(rows[0]) if rows else None
+
+    def iter_meetings(self, subject_id: str) -> Iterator[Meeting]:
+        """Yield the meetings for a subject, decoding each row only as it is consumed."""
+        for row in self._read(_SELECT_MEETINGS_SQL, (subject_id,)):
+            yield Meeting.from_row(row)
 
     def get_meetings(self, subject_id: str) -> list[Meeting]:
         """Get all meetings for a subject."""
-        cursor = self.conn.execute(
-            "SELECT * FROM meetings WHERE subject_id = ? ORDER BY date DESC",
-            (subject_id,)
-        )
-        return [Meeting.from_dict(dict(row)) for row in cursor.fetchall()]
+        return list(self.iter_meetings(subject_id))
+
+    def get_meetings_by_attendee(self, name: str) -> list[Meeting]:
+        """Get all meetings a person attended, newest first (name match ignores case)."""
+        return [Meeting.from_row(row) for row in self._fetch(_SELECT_MEETINGS_BY_ATTENDEE_SQL, (name,))]
 
     def update_meeting(self, meeting: Meeting) -> None:
         """Update an existing meeting."""
-        self.conn.execute(
-            """UPDATE meetings
-               SET title = ?, date = ?, attendees = ?, content = ?, updated_at = ?
-               WHERE id = ?""",
-            (
-                meeting.title,
-                meeting.date.isoformat(),
-                json.dumps(meeting.attendees),
-                meeting.content,
-                meeting.updated_at.isoformat(),
-                meeting.id,
+        with self.transaction():
+            self.conn.execute(
+                _UPDATE_MEETING_SQL,
+                (
+                    meeting.title,
+                    meeting.date.isoformat(),
+                    ", ".join(meeting.attendees),
+                    meeting.content,
+                    meeting.updated_at.isoformat(),
+                    meeting.id,
+                )
             )
-        )
-        self.conn.commit()
+            self.conn.execute(_DELETE_MEETING_ATTENDEES_SQL, (meeting.id,))
+            self._insert_attendees([meeting])
 
     def delete_meeting(self, meeting_id: str) -> None:
         """Delete a meeting."""
-        self.conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
-        self.conn.commit()
+        self.conn.execute(_DELETE_MEETING_SQL, (meeting_id,))
 
     # ==================== Action CRUD ====================
 
+    @staticmethod
+    def _action_values(action: Action) -> tuple:
+        """Get INSERT parameters for an action."""
+        return (
+            action.id,
+            action.subject_id,
+            action.title,
+            action.description,
+            action.status.value,
+            action.due_date.isoformat() if action.due_date else None,
+            action.created_at.isoformat(),
+            action.completed_at.isoformat() if action.completed_at else None,
+            action.archived_at.isoformat() if action.archived_at else None,
+            action.meeting_id,
+            action.note_id,
+            action.agenda_item_id,
+            ', '.join(action.tags) if action.tags else None,
+        )
+
     def add_action(self, action: Action) -> None:
         """Add a new action."""
-        self.conn.execute(
-            """INSERT INTO actions
-               (id, subject_id, title, description, status, due_date, created_at,
-                completed_at, archived_at, meeting_id, note_id, agenda_item_id, tags)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                action.id,
-                action.subject_id,
-                action.title,
-                action.description,
-                action.status.value,
-                action.due_date.isoformat() if action.due_date else None,
-                action.created_at.isoformat(),
-                action.completed_at.isoformat() if action.completed_at else None,
-                action.archived_at.isoformat() if action.archived_at else None,
-                action.meeting_id,
-                action.note_id,
-                action.agenda_item_id,
-                ', '.join(action.tags) if action.tags else None,
-            )
-        )
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_INSERT_ACTION_SQL, self._action_values(action))
+            self._insert_tags("action", [action])
+
+    def add_many_actions(self, actions: list[Action]) -> None:
+        """Add several actions in a single transaction."""
+        with self.transaction():
+            self._insert_many("actions", _ACTION_COLUMNS, [self._action_values(a) for a in actions])
+            self._insert_tags("action", actions)
 
     def get_action(self, action_id: str) -> Optional[Action]:
         """Get an action by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM actions WHERE id = ?",
-            (action_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return Action.from_dict(dict(row))
-        return None
-
-    def get_actions(self, subject_id: str) -> list[Action]:
-        """Get all actions for a subject."""
-        cursor = self.conn.execute(
-            "SELECT * FROM actions WHERE subject_id = ? ORDER BY due_date ASC",
-            (subject_id,)
-        )
-        return [Action.from_dict(dict(row)) for row in cursor.fetchall()]
+        rows = self._fetch(_SELECT_ACTION_SQL, (action_id,))
+        return Action.from_row(rows[0]) if rows else None
+
+    def iter_actions(self, subject_id: str, include_archived: bool = False) -> Iterator[Action]:
+        """Yield a subject's actions (archived ones only if asked), decoding each row as it is consumed."""
+        sql = _SELECT_ACTIONS_SQL if include_archived else _SELECT_UNARCHIVED_ACTIONS_SQL
+        for row in self._read(sql, (subject_id,)):
+            yield Action.from_row(row)
+
+    def get_actions(self, subject_id: str, include_archived: bool = False) -> list[Action]:
+        """Get a subject's actions, leaving out archived ones unless asked."""
+        return list(self.iter_actions(subject_id, include_archived))
 
     def update_action(self, action: Action) -> None:
         """Update an existing action."""
-        self.conn.execute(
-            """UPDATE actions
-               SET title = ?, description = ?, status = ?, due_date = ?,
-                   completed_at = ?, archived_at = ?, meeting_id = ?, note_id = ?,
-                   agenda_item_id = ?, tags = ?
-               WHERE id = ?""",
-            (
-                action.title,
-                action.description,
-                action.status.value,
-                action.due_date.isoformat() if action.due_date else None,
-                action.completed_at.isoformat() if action.completed_at else None,
-                action.archived_at.isoformat() if action.archived_at else None,
-                action.meeting_id,
-                action.note_id,
-                action.agenda_item_id,
-                ', '.join(action.tags) if action.tags else None,
-                action.id,
+        with self.transaction():
+            self.conn.execute(
+                _UPDATE_ACTION_SQL,
+                (
+                    action.title,
+                    action.description,
+                    action.status.value,
+                    action.due_date.isoformat() if action.due_date else None,
+                    action.completed_at.isoformat() if action.completed_at else None,
+                    action.archived_at.isoformat() if action.archived_at else None,
+                    action.meeting_id,
+                    action.note_id,
+                    action.agenda_item_id,
+                    ', '.join(action.tags) if action.tags else None,
+                    action.id,
+                )
             )
-        )
-        self.conn.commit()
+            self.conn.execute(_DELETE_TAGS_SQL, ("action", action.id))
+            self._insert_tags("action", [action])
 
     def delete_action(self, action_id: str) -> None:
         """Delete an action."""
-        self.conn.execute("DELETE FROM actions WHERE id = ?", (action_id,))
-        self.conn.commit()
+        self.conn.execute(_DELETE_ACTION_SQL, (action_id,))
+
+    def get_action_counts_by_subject(self, include_archived: bool = False) -> dict[str, int]:
+        """Count actions per subject ID (subjects with none are omitted)."""
+        return dict(self._fetch(_COUNT_ACTIONS_SQL if include_archived else _COUNT_UNARCHIVED_ACTIONS_SQL))
+
+    def get_actions_by_tag(self, tag: str) -> list[Action]:
+        """Get all actions with a tag (match ignores case)."""
+        return [Action.from_row(row) for row in self._fetch(_SELECT_ACTIONS_BY_TAG_SQL, (tag,))]
 
     def get_actions_by_timeframe(self, timeframe: str, include_archived: bool = False) -> list[dict]:
-        """Get actions by timeframe (today, week, next_week, all)."""
-        now = datetime.now()
-
-        conditions = []
-        params = []
-
-        if not include_archived:
-            conditions.append("archived_at IS NULL")
-
-        if timeframe == "today":
-            conditions.append("date(due_date) = date(?)")
-            params.append(now.isoformat())
-        elif timeframe == "week":
-            conditions.append("date(due_date) BETWEEN date(?) AND date(?, '+7 days')")
-            params.extend([now.isoformat(), now.isoformat()])
-        elif timeframe == "next_week":
-            conditions.append("date(due_date) BETWEEN date(?, '+8 days') AND date(?, '+14 days')")
-            params.extend([now.isoformat(), now.isoformat()])
-        elif timeframe == "all":
-            if not include_archived:
-                conditions.append("status != 'done' OR completed_at >= date('now', '-7 days')")
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        cursor = self.conn.execute(
-            f"""SELECT a.*, s.name as subject_name
-                FROM actions a
-                JOIN subjects s ON a.subject_id = s.id
-                WHERE {where_clause}
-                ORDER BY
-                    CASE WHEN due_date IS NULL THEN 1 ELSE 0 END,
-                    due_date ASC""",
-            params
-        )
+        """Get actions by timeframe (today, week, next_week, all).
 
+        Each row also has subject_name and overdue (1 when an unfinished
+        action was due before today, else 0 or None).
+        """
+        sql = _TIMEFRAME_SQL.get((timeframe, include_archived)) or _timeframe_sql(timeframe, include_archived)
+        cursor = self.conn.execute(sql, _timeframe_params(datetime.now()))
         return [dict(row) for row in cursor.fetchall()]
 
     def get_actions_by_meeting(self, meeting_id: str) -> list[Action]:
         """Get all actions created from a meeting."""
-        cursor = self.conn.execute(
-            "SELECT * FROM actions WHERE meeting_id = ? AND archived_at IS NULL ORDER BY created_at DESC",
-            (meeting_id,)
-        )
-        return [Action.from_dict(dict(row)) for row in cursor.fetchall()]
+        return [Action.from_row(row) for row in self._fetch(_SELECT_ACTIONS_BY_MEETING_SQL, (meeting_id,))]
 
     def get_actions_by_note(self, note_id: str) -> list[Action]:
         """Get all actions created from a note."""
-        cursor = self.conn.execute(
-            "SELECT * FROM actions WHERE note_id = ? AND archived_at IS NULL ORDER BY created_at DESC",
-            (note_id,)
-        )
-        return [Action.from_dict(dict(row)) for row in cursor.fetchall()]
+        return [Action.from_row(row) for row in self._fetch(_SELECT_ACTIONS_BY_NOTE_SQL, (note_id,))]
 
     # ==================== Note CRUD ====================
 
+    @staticmethod
+    def _note_values(note: Note) -> tuple:
+        """Get INSERT parameters for a note."""
+        return (
+            note.id,
+            note.subject_id,
+            note.title,
+            note.content,
+            ', '.join(note.tags) if note.tags else None,
+            note.created_at.isoformat(),
+            note.updated_at.isoformat(),
+        )
+
     def add_note(self, note: Note) -> None:
         """Add a new note."""
-        self.conn.execute(
-            """INSERT INTO notes
-               (id, subject_id, title, content, tags, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                note.id,
-                note.subject_id,
-                note.title,
-                note.content,
-                ', '.join(note.tags) if note.tags else None,
-                note.created_at.isoformat(),
-                note.updated_at.isoformat(),
-            )
-        )
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute(_INSERT_NOTE_SQL, self._note_values(note))
+            self._insert_tags("note", [note])
+
+    def add_many_notes(self, notes: list[Note]) -> None:
+        """Add several notes in a single transaction."""
+        with self.transaction():
+            self._insert_many("notes", _NOTE_COLUMNS, [self._note_values(n) for n in notes])
+            self._insert_tags("note", notes)
 
     def get_note(self, note_id: str) -> Optional[Note]:
         """Get a note by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM notes WHERE id = ?",
-            (note_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return Note.from_dict(dict(row))
-        return None
+        rows = self._fetch(_SELECT_NOTE_SQL, (note_id,))
+        return Note.from_row(rows[0]) if rows else None
+
+    def iter_notes(self, subject_id: str) -> Iterator[Note]:
+        """Yield the notes for a subject, decoding each row only as it is consumed."""
+        for row in self._read(_SELECT_NOTES_SQL, (subject_id,)):
+            yield Note.from_row(row)
 
     def get_notes(self, subject_id: str) -> list[Note]:
         """Get all notes for a subject."""
-        cursor = self.conn.execute(
-            "SELECT * FROM notes WHERE subject_id = ? ORDER BY updated_at DESC",
-            (subject_id,)
-        )
-        return [Note.from_dict(dict(row)) for row in cursor.fetchall()]
+        return list(self.iter_notes(subject_id))
+
+    def get_notes_by_tag(self, tag: str) -> list[Note]:
+        """Get all notes with a tag (match ignores case)."""
+        return [Note.from_row(row) for row in self._fetch(_SELECT_NOTES_BY_TAG_SQL, (tag,))]
 
     def update_note(self, note: Note) -> None:
         """Update an existing note."""
-        self.conn.execute(
-            """UPDATE notes
-               SET title = ?, content = ?, tags = ?, updated_at = ?
-               WHERE id = ?""",
-            (
-                note.title,
-                note.content,
-                ', '.join(note.tags) if note.tags else None,
-                note.updated_at.isoformat(),
-                note.id,
+        with self.transaction():
+            self.conn.execute(
+                _UPDATE_NOTE_SQL,
+                (
+                    note.title,
+                    note.content,
+                    ', '.join(note.tags) if note.tags else None,
+                    note.updated_at.isoformat(),
+                    note.id,
+                )
             )
-        )
-        self.conn.commit()
+            self.conn.execute(_DELETE_TAGS_SQL, ("note", note.id))
+            self._insert_tags("note", [note])
 
     def delete_note(self, note_id: str) -> None:
         """Delete a note."""
-        self.conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-        self.conn.commit()
+        self.conn.execute(_DELETE_NOTE_SQL, (note_id,))
 
     # ==================== Unified Search ====================
 
@@ -633,6 +1166,7 @@ class Database:
 
         Returns:
             List of dicts with: content_type, content_id, subject_id, subject_name, title, rank
+            Ordered by rank, which weights title matches over subject name and body text
             Returns empty list if query is invalid (e.g., unbalanced quotes)
         """
         if not query or not query.strip():
@@ -665,6 +1199,15 @@ class Database:
 
     # ==================== Utility ====================
 
+    @property
+    def total_changes(self) -> int:
+        """Count of rows written through this connection; any write changes it.
+
+        Callers holding rows from an earlier query can compare it to tell
+        whether those rows may be stale.
+        """
+        return self.conn.total_changes
+
     def close(self) -> None:
         """Close database connection."""
         if self.conn:
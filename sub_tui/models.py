@@ -6,6 +6,33 @@ from enum import Enum
 from typing import Optional
 
 
+def _parse_attendees(value) -> list[str]:
+    """Parse attendees stored as a list or comma-separated string.
+
+    Legacy JSON-encoded lists are converted by a database migration, so a
+    leading "[" is just part of the first name.
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [a.strip() for a in value.split(",") if a.strip()]
+    return []
+
+
+def _parse_tags(value) -> list[str]:
+    """Parse tags stored as a list, comma-separated string or None."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and value:
+        return [t.strip() for t in value.split(",") if t.strip()]
+    return []
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an optional ISO timestamp."""
+    return datetime.fromisoformat(value) if value else None
+
+
 class SubjectType(str, Enum):
     """Types of subjects that can be managed."""
     BOARD = "board"
@@ -45,7 +72,15 @@ class ActionStatus(str, Enum):
         return {"todo": "TODO", "in_progress": "In Progress", "done": "Done"}[self.value]
 
 
-@dataclass
+# Stored value -> member lookups used when decoding rows; a dict hit skips
+# the Enum call machinery, which adds up over long lists
+_SUBJECT_TYPES = {t.value: t for t in SubjectType}
+_AGENDA_STATUSES = {s.value: s for s in AgendaStatus}
+_RECURRENCE_PATTERNS = {p.value: p for p in RecurrencePattern}
+_ACTION_STATUSES = {s.value: s for s in ActionStatus}
+
+
+@dataclass(slots=True)
 class Subject:
     """A subject represents a context for organizing information."""
     id: str
@@ -74,15 +109,29 @@ class Subject:
         return cls(
             id=data["id"],
             name=data["name"],
-            type=SubjectType(data["type"]),
+            type=_SUBJECT_TYPES[data["type"]],
             code=data.get("code"),
             description=data.get("description"),
             created_at=datetime.fromisoformat(data["created_at"]),
             last_reviewed_at=datetime.fromisoformat(data["last_reviewed_at"]),
         )
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Subject":
+        """Create from a subjects row selected in Database column order."""
+        subject_id, name, code, subject_type, description, created_at, last_reviewed_at = row
+        return cls(
+            id=subject_id,
+            name=name,
+            type=_SUBJECT_TYPES[subject_type],
+            code=code,
+            description=description,
+            created_at=datetime.fromisoformat(created_at),
+            last_reviewed_at=datetime.fromisoformat(last_reviewed_at),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class AgendaItem:
     """Things to discuss in the next encounter with a subject."""
     id: str
@@ -120,15 +169,33 @@ class AgendaItem:
             title=data["title"],
             description=data.get("description"),
             priority=data["priority"],
-            status=AgendaStatus(data["status"]),
+            status=_AGENDA_STATUSES[data["status"]],
             created_at=datetime.fromisoformat(data["created_at"]),
             discussed_at=datetime.fromisoformat(data["discussed_at"]) if data.get("discussed_at") else None,
             is_recurring=data.get("is_recurring", False),
-            recurrence_pattern=RecurrencePattern(data["recurrence_pattern"]) if data.get("recurrence_pattern") else None,
+            recurrence_pattern=_RECURRENCE_PATTERNS[data["recurrence_pattern"]] if data.get("recurrence_pattern") else None,
+        )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "AgendaItem":
+        """Create from an agenda_items row selected in Database column order."""
+        (item_id, subject_id, title, description, priority, status, created_at,
+         discussed_at, is_recurring, recurrence_pattern) = row
+        return cls(
+            id=item_id,
+            subject_id=subject_id,
+            title=title,
+            description=description,
+            priority=priority,
+            status=_AGENDA_STATUSES[status],
+            created_at=datetime.fromisoformat(created_at),
+            discussed_at=_parse_datetime(discussed_at),
+            is_recurring=bool(is_recurring),
+            recurrence_pattern=_RECURRENCE_PATTERNS[recurrence_pattern] if recurrence_pattern else None,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Meeting:
     """Records of encounters with a subject."""
     id: str
@@ -156,33 +223,34 @@ class Meeting:
     @classmethod
     def from_dict(cls, data: dict) -> "Meeting":
         """Create from dictionary."""
-        # Parse attendees - can be JSON string, list, or comma-separated string
-        attendees_data = data["attendees"]
-        if isinstance(attendees_data, list):
-            attendees = attendees_data
-        elif isinstance(attendees_data, str):
-            # Try JSON first, fall back to comma-separated
-            if attendees_data.startswith("["):
-                import json
-                attendees = json.loads(attendees_data)
-            else:
-                attendees = [a.strip() for a in attendees_data.split(",") if a.strip()]
-        else:
-            attendees = []
-
         return cls(
             id=data["id"],
             subject_id=data["subject_id"],
             title=data.get("title", "Meeting"),  # Default for old data
             date=datetime.fromisoformat(data["date"]),
-            attendees=attendees,
+            attendees=_parse_attendees(data["attendees"]),
             content=data["content"],
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
         )
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Meeting":
+        """Create from a meetings row selected in Database column order."""
+        meeting_id, subject_id, title, date, attendees, content, created_at, updated_at = row
+        return cls(
+            id=meeting_id,
+            subject_id=subject_id,
+            title=title,
+            date=datetime.fromisoformat(date),
+            attendees=_parse_attendees(attendees),
+            content=content,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Personal tasks related to subjects."""
     id: str
@@ -220,21 +288,12 @@ class Action:
     @classmethod
     def from_dict(cls, data: dict) -> "Action":
         """Create from dictionary."""
-        # Parse tags - can be a list, comma-separated string, or None
-        tags_data = data.get("tags")
-        if isinstance(tags_data, list):
-            tags = tags_data
-        elif isinstance(tags_data, str) and tags_data:
-            tags = [t.strip() for t in tags_data.split(",") if t.strip()]
-        else:
-            tags = []
-
         return cls(
             id=data["id"],
             subject_id=data["subject_id"],
             title=data["title"],
             description=data.get("description"),
-            status=ActionStatus(data["status"]),
+            status=_ACTION_STATUSES[data["status"]],
             due_date=datetime.fromisoformat(data["due_date"]) if data.get("due_date") else None,
             created_at=datetime.fromisoformat(data["created_at"]),
             completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
@@ -242,11 +301,32 @@ class Action:
             meeting_id=data.get("meeting_id"),
             note_id=data.get("note_id"),
             agenda_item_id=data.get("agenda_item_id"),
-            tags=tags,
+            tags=_parse_tags(data.get("tags")),
         )
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Action":
+        """Create from an actions row selected in Database column order."""
+        (action_id, subject_id, title, description, status, due_date, created_at,
+         completed_at, archived_at, meeting_id, note_id, agenda_item_id, tags) = row
+        return cls(
+            id=action_id,
+            subject_id=subject_id,
+            title=title,
+            description=description,
+            status=_ACTION_STATUSES[status],
+            due_date=_parse_datetime(due_date),
+            created_at=datetime.fromisoformat(created_at),
+            completed_at=_parse_datetime(completed_at),
+            archived_at=_parse_datetime(archived_at),
+            meeting_id=meeting_id,
+            note_id=note_id,
+            agenda_item_id=agenda_item_id,
+            tags=_parse_tags(tags),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class Note:
     """Reference information and documentation."""
     id: str
@@ -272,21 +352,36 @@ class Note:
     @classmethod
     def from_dict(cls, data: dict) -> "Note":
         """Create from dictionary."""
-        # Parse tags - can be a list, comma-separated string, or None
-        tags_data = data.get("tags")
-        if isinstance(tags_data, list):
-            tags = tags_data
-        elif isinstance(tags_data, str) and tags_data:
-            tags = [t.strip() for t in tags_data.split(",") if t.strip()]
-        else:
-            tags = []
-
         return cls(
             id=data["id"],
             subject_id=data["subject_id"],
             title=data["title"],
             content=data["content"],
-            tags=tags,
+            tags=_parse_tags(data.get("tags")),
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
         )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Note":
+        """Create from a notes row selected in Database column order."""
+        note_id, subject_id, title, content, tags, created_at, updated_at = row
+        return cls(
+            id=note_id,
+            subject_id=subject_id,
+            title=title,
+            content=content,
+            tags=_parse_tags(tags),
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+
+@dataclass(slots=True)
+class SubjectBundle:
+    """A subject together with everything shown on its detail screen."""
+    subject: Subject
+    actions: list[Action]
+    agenda_items: list[AgendaItem]
+    meetings: list[Meeting]
+    notes: list[Note]
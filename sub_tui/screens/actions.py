@@ -1,17 +1,54 @@
 """Main dashboard screen."""
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Grid
+from textual.coordinate import Coordinate
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Header, Label, Static
 
 from ..database import Database
-from ..models import ActionStatus, SubjectType
-from ..widgets import ConfirmDialog, NewActionDialog, NewSubjectDialog, SubjectLookupDialog, format_date_locale
+from ..models import Action, ActionStatus, SubjectType
+from ..widgets import (
+    ConfirmDialog,
+    NewActionDialog,
+    NewSubjectDialog,
+    SubjectLookupDialog,
+    format_date_locale,
+    sync_table_rows,
+)
+from .subjects import SubjectDetailScreen
+
+
+# Subject tables on the dashboard: (table selector, subject type)
+_SUBJECT_TABLES = (
+    ("#projects-table", SubjectType.PROJECT),
+    ("#boards-table", SubjectType.BOARD),
+    ("#teams-table", SubjectType.TEAM),
+    ("#people-table", SubjectType.PERSON),
+)
+
+# Rich markup for each action status in the actions table
+_STATUS_MAP = {
+    "todo": "[dim]TODO[/dim]",
+    "in_progress": "[yellow]IN PROGRESS[/yellow]",
+    "done": "[green]DONE[/green]",
+}
+
+# Due date cell markup, indexed by the overdue flag
+_DUE_FMT = ("{}", "[red]{}[/red]")
+
+
+@lru_cache(maxsize=4096)
+def _format_due(due_day: str, overdue: bool) -> str:
+    """Format a due day (YYYY-MM-DD) for the actions table, red when overdue."""
+    return _DUE_FMT[overdue].format(format_date_locale(date.fromisoformat(due_day)))
 
 
 class MainDashboard(Screen):
@@ -38,11 +75,9 @@ class MainDashboard(Screen):
         self.db = db
         self.current_filter = "today"
         self.show_archived = False
-        self.action_ids: list[str] = []  # Maps table rows to action IDs
-        self.project_ids: list[str] = []  # Maps table rows to project IDs
-        self.board_ids: list[str] = []  # Maps table rows to board IDs
-        self.team_ids: list[str] = []  # Maps table rows to team IDs
-        self.person_ids: list[str] = []  # Maps table rows to person IDs
+        self._refresh_timer: Timer | None = None  # Pending debounced refresh_actions
+        self._action_rows: dict[str, dict] = {}  # Rows from the last refresh_actions, by ID
+        self._action_rows_version = -1  # db.total_changes when _action_rows was loaded
 
     def compose(self) -> ComposeResult:
         """Compose the UI."""
@@ -100,93 +135,102 @@ class MainDashboard(Screen):
 
     def on_mount(self) -> None:
         """Handle mount event."""
+        # Look the tables up once; the handlers below use these references
+        self._actions_table = self.query_one("#actions-table", DataTable)
+        self._subject_tables = [
+            (self.query_one(table_id, DataTable), subject_type)
+            for table_id, subject_type in _SUBJECT_TABLES
+        ]
         self.refresh_actions()
         self.refresh_subjects()
 
     def on_data_table_row_selected(self, event) -> None:
         """Handle row selection (Enter key on a row)."""
-        table_id = event.data_table.id
-
-        if table_id == "actions-table":
+        if event.data_table.id == "actions-table":
             # Open the subject detail screen for this action
             self.action_open_subject()
-        elif table_id == "projects-table":
-            self.open_subject_from_table(self.project_ids, event.cursor_row)
-        elif table_id == "boards-table":
-            self.open_subject_from_table(self.board_ids, event.cursor_row)
-        elif table_id == "teams-table":
-            self.open_subject_from_table(self.team_ids, event.cursor_row)
-        elif table_id == "people-table":
-            self.open_subject_from_table(self.person_ids, event.cursor_row)
+        else:
+            # Subject table rows are keyed by subject ID
+            self.open_subject(event.row_key.value)
 
     def refresh_actions(self) -> None:
         """Refresh the actions list."""
-        table = self.query_one("#actions-table", DataTable)
-        table.clear()
-        self.action_ids = []  # Reset ID mapping
+        table = self._actions_table
 
         actions = self.db.get_actions_by_timeframe(
             self.current_filter,
             include_archived=self.show_archived
         )
-
-        now = datetime.now()
-
-        for action in actions:
-            subject_name = action.get("subject_name", "Unknown")
-            title = action["title"]
-            due = action.get("due_date", "")
-            status = action["status"]
-            action_id = action["id"]
-
-            # Store action ID for this row
-            self.action_ids.append(action_id)
-
-            # Format due date
-            if due:
-                due_dt = datetime.fromisoformat(due)
-                due_str = format_date_locale(due_dt)
-
-                # Highlight overdue
-                if due_dt.date() < now.date() and status != "done":
-                    due_str = f"[red]{due_str}[/red]"
-            else:
-                due_str = "-"
-
-            # Format status
-            status_map = {
-                "todo": "[dim]TODO[/dim]",
-                "in_progress": "[yellow]IN PROGRESS[/yellow]",
-                "done": "[green]DONE[/green]"
-            }
-            status_str = status_map.get(status, status)
-
-            table.add_row(subject_name, title, due_str, status_str)
+        self._action_rows = {action["id"]: action for action in actions}
+        self._action_rows_version = self.db.total_changes
+
+        rows = [(action["id"], self._action_cells(action)) for action in actions]
+
+        # Apply only what changed, so rows that stay keep their place and
+        # the cursor does not jump back to the top
+        sync_table_rows(table, rows)
+
+    @staticmethod
+    def _action_cells(action: dict) -> tuple[str, str, str, str]:
+        """Format the actions table cells for a get_actions_by_timeframe row."""
+        due = action.get("due_date", "")
+        status = action["status"]
+
+        # Format due date, highlighting overdue ones (flagged by the query)
+        if due:
+            # Only the day is shown, so key the cache on it rather than the
+            # full timestamp
+            due_str = _format_due(due[:10], bool(action["overdue"]))
+        else:
+            due_str = "-"
+
+        status_str = _STATUS_MAP.get(status, status)
+        return action.get("subject_name", "Unknown"), action["title"], due_str, status_str
+
+    @staticmethod
+    def _cursor_key(table: DataTable) -> Optional[str]:
+        """Get the ID keying the row under the table cursor, if any."""
+        if not table.row_count:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
+        return row_key.value
+
+    def _get_action(self, action_id: str) -> Optional[Action]:
+        """Get an action, reusing its row from the last refresh if nothing was written since."""
+        if self.db.total_changes == self._action_rows_version and action_id in self._action_rows:
+            return Action.from_dict(self._action_rows[action_id])
+        return self.db.get_action(action_id)
 
     def action_filter_today(self) -> None:
         """Filter to today's actions."""
         self.current_filter = "today"
-        self.refresh_actions()
+        self._schedule_refresh_actions()
 
     def action_filter_week(self) -> None:
         """Filter to this week's actions."""
         self.current_filter = "week"
-        self.refresh_actions()
+        self._schedule_refresh_actions()
 
     def action_filter_next_week(self) -> None:
         """Filter to next week's actions."""
         self.current_filter = "next_week"
-        self.refresh_actions()
+        self._schedule_refresh_actions()
 
     def action_filter_all(self) -> None:
         """Show all active actions."""
         self.current_filter = "all"
-        self.refresh_actions()
+        self._schedule_refresh_actions()
 
     def action_toggle_archived(self) -> None:
         """Toggle showing archived actions."""
         self.show_archived = not self.show_archived
-        self.refresh_actions()
+        self._schedule_refresh_actions()
+
+    def _schedule_refresh_actions(self) -> None:
+        """Refresh the actions table once a burst of filter key presses settles."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(0.05, self.refresh_actions)
 
     @work
     async def action_add_action(self) -> None:
@@ -197,12 +241,12 @@ class MainDashboard(Screen):
 
     def action_toggle_action_status(self) -> None:
         """Toggle status of selected action (TODO → IN_PROGRESS → DONE → TODO)."""
-        table = self.query_one("#actions-table", DataTable)
-        if table.cursor_row is None or table.cursor_row >= len(self.action_ids):
+        table = self._actions_table
+        action_id = self._cursor_key(table)
+        if action_id is None:
             return
 
-        action_id = self.action_ids[table.cursor_row]
-        action = self.db.get_action(action_id)
+        action = self._get_action(action_id)
         if not action:
             return
 
@@ -216,18 +260,36 @@ class MainDashboard(Screen):
             action.status = ActionStatus.TODO
             action.completed_at = None
 
+        # The subject cards count unarchived actions whatever their status,
+        # so a status change leaves them alone
+        in_sync = self.db.total_changes == self._action_rows_version
         self.db.update_action(action)
-        self.refresh_actions()
+        row = self._action_rows.get(action.id)
+        if in_sync and row:
+            # A status change never moves an action in or out of the current
+            # filter, so only this row's status and overdue cells change
+            due = row["due_date"]
+            row["status"] = action.status.value
+            row["completed_at"] = action.completed_at.isoformat() if action.completed_at else None
+            row["overdue"] = (
+                bool(due) and due[:10] < date.today().isoformat()
+                and action.status != ActionStatus.DONE
+            )
+            self._action_rows_version = self.db.total_changes
+            row_index = table.get_row_index(action.id)
+            for column, value in enumerate(self._action_cells(row)):
+                table.update_cell_at(Coordinate(row_index, column), value)
+        else:
+            self.refresh_actions()
         self.notify(f"Action status: {action.status.value}")
 
     def action_delete_action(self) -> None:
         """Delete selected action."""
-        table = self.query_one("#actions-table", DataTable)
-        if table.cursor_row is None or table.cursor_row >= len(self.action_ids):
+        action_id = self._cursor_key(self._actions_table)
+        if action_id is None:
             return
 
-        action_id = self.action_ids[table.cursor_row]
-        action = self.db.get_action(action_id)
+        action = self._get_action(action_id)
         if not action:
             return
 
@@ -240,31 +302,42 @@ class MainDashboard(Screen):
             ConfirmDialog("Delete Action", f"Delete action '{action.title}'?")
         )
         if confirmed:
+            in_sync = self.db.total_changes == self._action_rows_version
             self.db.delete_action(action.id)
-            self.refresh_actions()
+            if in_sync and action.id in self._action_rows:
+                # Drop just this row rather than re-running the query
+                self._actions_table.remove_row(action.id)
+                del self._action_rows[action.id]
+                self._action_rows_version = self.db.total_changes
+            else:
+                self.refresh_actions()
+            # Subject cards count unarchived actions only
+            if action.archived_at is None:
+                self._bump_subject_count(action.subject_id, -1)
             self.notify(f"Deleted action: {action.title}")
 
+    def _bump_subject_count(self, subject_id: str, delta: int) -> None:
+        """Adjust a subject card's action count in place instead of refreshing every card."""
+        for table, _ in self._subject_tables:
+            if subject_id in table.rows:
+                coordinate = Coordinate(table.get_row_index(subject_id), 1)
+                count = int(table.get_cell_at(coordinate)) + delta
+                table.update_cell_at(coordinate, str(count))
+                return
+
     def action_open_subject(self) -> None:
         """Open subject detail view for the selected action."""
-        table = self.query_one("#actions-table", DataTable)
+        action_id = self._cursor_key(self._actions_table)
 
-        if table.cursor_row is None:
+        if action_id is None:
             self.notify("No action selected", severity="warning")
             return
 
-        if table.cursor_row >= len(self.action_ids):
-            self.notify("Invalid action selected", severity="error")
-            return
-
-        action_id = self.action_ids[table.cursor_row]
-        action = self.db.get_action(action_id)
+        action = self._get_action(action_id)
         if not action:
             self.notify("Action not found", severity="error")
             return
 
-        # Import here to avoid circular dependency
-        from .subjects import SubjectDetailScreen
-
         # Push subject detail screen with selected action
         self.app.push_screen(SubjectDetailScreen(self.db, action.subject_id, selected_action_id=action_id))
 
@@ -273,18 +346,10 @@ class MainDashboard(Screen):
         """Open subject lookup dialog."""
         subject_id = await self.app.push_screen_wait(SubjectLookupDialog(self.db))
         if subject_id:
-            # Import here to avoid circular dependency
-            from .subjects import SubjectDetailScreen
             self.app.push_screen(SubjectDetailScreen(self.db, subject_id))
 
-    def open_subject_from_table(self, subject_ids: list[str], row_index: int) -> None:
-        """Open subject detail screen from a subject table."""
-        if row_index is None or row_index >= len(subject_ids):
-            return
-
-        subject_id = subject_ids[row_index]
-        # Import here to avoid circular dependency
-        from .subjects import SubjectDetailScreen
+    def open_subject(self, subject_id: str) -> None:
+        """Open subject detail screen for a subject table row."""
         self.app.push_screen(SubjectDetailScreen(self.db, subject_id))
 
     def get_focused_table(self) -> tuple[DataTable | None, str]:
@@ -303,17 +368,9 @@ class MainDashboard(Screen):
         if table_id == "actions-table":
             self.action_open_subject()
         elif table_id in ("projects-table", "boards-table", "teams-table", "people-table"):
-            # Get the appropriate ID list
-            if table_id == "projects-table":
-                ids = self.project_ids
-            elif table_id == "boards-table":
-                ids = self.board_ids
-            elif table_id == "teams-table":
-                ids = self.team_ids
-            else:  # people-table
-                ids = self.person_ids
-
-            self.open_subject_from_table(ids, table.cursor_row)
+            subject_id = self._cursor_key(table)
+            if subject_id is not None:
+                self.open_subject(subject_id)
 
     def action_add_item(self) -> None:
         """Add new item (context-aware based on focused table)."""
@@ -349,18 +406,8 @@ class MainDashboard(Screen):
         if table_id == "actions-table":
             self.action_delete_action()
         elif table_id in ("projects-table", "boards-table", "teams-table", "people-table"):
-            # Get the appropriate ID list
-            if table_id == "projects-table":
-                ids = self.project_ids
-            elif table_id == "boards-table":
-                ids = self.board_ids
-            elif table_id == "teams-table":
-                ids = self.team_ids
-            else:  # people-table
-                ids = self.person_ids
-
-            if table.cursor_row < len(ids):
-                subject_id = ids[table.cursor_row]
+            subject_id = self._cursor_key(table)
+            if subject_id is not None:
                 subject = self.db.get_subject(subject_id)
                 if subject:
                     self.app.call_later(self._confirm_delete_subject, subject)
@@ -381,56 +428,28 @@ class MainDashboard(Screen):
             self.notify(f"Deleted subject: {subject.name}")
 
     def refresh_subjects(self) -> None:
-        """Refresh the subjects tables."""
+        """Refresh the subjects tables.
+
+        Only needed when subjects are added or removed; action deletes adjust
+        the affected count with _bump_subject_count instead.
+        """
         # Get all subjects
         all_subjects = self.db.get_all_subjects()
 
-        # Group by type
-        projects = [s for s in all_subjects if s.type == SubjectType.PROJECT]
-        boards = [s for s in all_subjects if s.type == SubjectType.BOARD]
-        teams = [s for s in all_subjects if s.type == SubjectType.TEAM]
-        people = [s for s in all_subjects if s.type == SubjectType.PERSON]
-
-        def get_counts(subject_id: str) -> tuple[int, int]:
-            """Get action count and active agenda count for a subject."""
-            actions = self.db.get_actions(subject_id)
-            action_count = len([a for a in actions if not a.archived_at])
-            agenda_items = self.db.get_agenda_items(subject_id)
-            agenda_count = len([i for i in agenda_items if i.status.value == "active"])
-            return action_count, agenda_count
-
-        # Update projects table
-        projects_table = self.query_one("#projects-table", DataTable)
-        projects_table.clear()
-        self.project_ids = []
-        for subject in projects:
-            self.project_ids.append(subject.id)
-            action_count, agenda_count = get_counts(subject.id)
-            projects_table.add_row(subject.name, str(action_count), str(agenda_count))
-
-        # Update boards table
-        boards_table = self.query_one("#boards-table", DataTable)
-        boards_table.clear()
-        self.board_ids = []
-        for subject in boards:
-            self.board_ids.append(subject.id)
-            action_count, agenda_count = get_counts(subject.id)
-            boards_table.add_row(subject.name, str(action_count), str(agenda_count))
-
-        # Update teams table
-        teams_table = self.query_one("#teams-table", DataTable)
-        teams_table.clear()
-        self.team_ids = []
-        for subject in teams:
-            self.team_ids.append(subject.id)
-            action_count, agenda_count = get_counts(subject.id)
-            teams_table.add_row(subject.name, str(action_count), str(agenda_count))
-
-        # Update people table
-        people_table = self.query_one("#people-table", DataTable)
-        people_table.clear()
-        self.person_ids = []
-        for subject in people:
-            self.person_ids.append(subject.id)
-            action_count, agenda_count = get_counts(subject.id)
-            people_table.add_row(subject.name, str(action_count), str(agenda_count))
+        # Group by type in a single pass
+        by_type: dict[SubjectType, list] = {subject_type: [] for subject_type in SubjectType}
+        for subject in all_subjects:
+            by_type[subject.type].append(subject)
+
+        # Count every subject's actions and agenda items in two queries
+        # rather than loading each subject's rows
+        action_counts = self.db.get_action_counts_by_subject()
+        agenda_counts = self.db.get_active_agenda_counts_by_subject()
+
+        def subject_cells(subject) -> tuple[str, str, str]:
+            """Format a subject's name, action count and active agenda count."""
+            return subject.name, str(action_counts.get(subject.id, 0)), str(agenda_counts.get(subject.id, 0))
+
+        for table, subject_type in self._subject_tables:
+            rows = [(subject.id, subject_cells(subject)) for subject in by_type[subject_type]]
+            sync_table_rows(table, rows)
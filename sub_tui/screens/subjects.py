@@ -12,7 +12,22 @@ from textual.widgets import DataTable, Footer, Header, Static, Label
 
 from ..database import Database
 from ..models import Action, AgendaItem, Meeting, Note, Subject
-from ..widgets import ConfirmDialog, EditSubjectDialog, NewActionDialog, NewAgendaDialog, NewMeetingDialog, NewNoteDialog, SubjectLookupDialog, ViewActionDialog, ViewAgendaDialog, ViewMeetingDialog, ViewNoteDialog, format_date_locale
+from ..widgets import ConfirmDialog, EditSubjectDialog, NewActionDialog, NewAgendaDialog, NewMeetingDialog, NewNoteDialog, SubjectLookupDialog, ViewActionDialog, ViewAgendaDialog, ViewMeetingDialog, ViewNoteDialog, format_dates_locale, sync_table_rows
+
+
+# Rich markup for each action and agenda item status in the section tables
+_ACTION_STATUS_MARKUP = {
+    "todo": "[dim]TODO[/dim]",
+    "in_progress": "[yellow]IN PROGRESS[/yellow]",
+    "done": "[green]✓ DONE[/green]",
+}
+_AGENDA_STATUS_MARKUP = {
+    "active": "[yellow]ACTIVE[/yellow]",
+    "discussed": "[dim]DISCUSSED[/dim]",
+}
+
+# Agenda priority cells for priorities 0-5; higher ones show "★★★★★+N"
+_STARS = tuple("★" * i for i in range(6))
 
 
 class SubjectDetailScreen(Screen):
@@ -91,13 +106,20 @@ class SubjectDetailScreen(Screen):
         self.subject_id = subject_id
         self.selected_action_id = selected_action_id
         self.subject_name = ""  # Will be set when subject is loaded
+        self._subject: Optional[Subject] = None  # Subject as last loaded, for the edit dialog
 
-        # Track IDs for each section
+        # Track IDs for each section, in table row order
         self.action_ids: list[str] = []
         self.agenda_ids: list[str] = []
         self.meeting_ids: list[str] = []
         self.note_ids: list[str] = []
 
+        # Items shown in each section, by ID, so row handlers need no re-fetch
+        self.actions_by_id: dict[str, Action] = {}
+        self.agenda_by_id: dict[str, AgendaItem] = {}
+        self.meetings_by_id: dict[str, Meeting] = {}
+        self.notes_by_id: dict[str, Note] = {}
+
     def compose(self) -> ComposeResult:
         """Compose the UI with card-based sections in single column."""
         yield Header()
@@ -156,14 +178,16 @@ class SubjectDetailScreen(Screen):
 
     def load_subject_data(self) -> None:
         """Load all subject data."""
-        # Load subject info
-        subject = self.db.get_subject(self.subject_id)
-        if not subject:
+        # Load the subject and all its sections in one go
+        bundle = self.db.get_subject_bundle(self.subject_id)
+        if not bundle:
             self.notify("Subject not found", severity="error")
             self.app.pop_screen()
             return
+        subject = bundle.subject
 
-        # Store subject name for dialogs
+        # Store subject and its name for dialogs
+        self._subject = subject
         self.subject_name = subject.name
 
         # Update header border title with subject name
@@ -183,118 +207,110 @@ class SubjectDetailScreen(Screen):
             info_widget = self.query_one("#subject-info", Static)
             info_widget.update(" | ".join(info_parts))
 
-        # Load all sections
-        self.refresh_actions()
-        self.refresh_agenda()
-        self.refresh_meetings()
-        self.refresh_notes()
+        # Show all sections
+        self._render_actions(bundle.actions)
+        self._render_agenda(bundle.agenda_items)
+        self._render_meetings(bundle.meetings)
+        self._render_notes(bundle.notes)
+
+    @staticmethod
+    def _sync_section(table: DataTable, rows: list[tuple[str, tuple]], empty_message: str) -> None:
+        """Apply a section's rows to its table, or a placeholder row when there are none."""
+        if not rows:
+            # The placeholder's empty key never matches an item ID
+            rows = [("", (f"[dim italic]{empty_message}[/dim italic]", "", ""))]
+        # Apply only what changed, so an edit touches just the edited row
+        sync_table_rows(table, rows)
 
     def refresh_actions(self) -> None:
         """Refresh the actions section."""
-        table = self.query_one("#actions-table", DataTable)
-        table.clear()
-        self.action_ids = []
-
-        actions = self.db.get_actions(self.subject_id)
+        self._render_actions(self.db.get_actions(self.subject_id))
 
-        for action in actions:
-            # Skip archived actions
-            if action.archived_at:
-                continue
+    def _render_actions(self, actions: list[Action]) -> None:
+        """Show the given actions in the actions section."""
+        table = self.query_one("#actions-table", DataTable)
 
-            self.action_ids.append(action.id)
+        self.actions_by_id = {action.id: action for action in actions}
+        self.action_ids = list(self.actions_by_id)
 
-            # Format due date
-            due_str = "-"
-            if action.due_date:
-                due_str = format_date_locale(action.due_date)
-                if action.due_date.date() < datetime.now().date() and action.status.value != "done":
-                    due_str = f"[red]{due_str}[/red]"
+        today = datetime.now().date()
+        due_strs = format_dates_locale([action.due_date for action in actions])
+        rows = []
+        for action, due_str in zip(actions, due_strs):
+            # Highlight overdue due dates
+            if action.due_date and action.due_date.date() < today and action.status.value != "done":
+                due_str = f"[red]{due_str}[/red]"
 
-            # Format status
-            status_map = {
-                "todo": "[dim]TODO[/dim]",
-                "in_progress": "[yellow]IN PROGRESS[/yellow]",
-                "done": "[green]✓ DONE[/green]"
-            }
-            status_str = status_map.get(action.status.value, action.status.value)
+            status_str = _ACTION_STATUS_MARKUP.get(action.status.value, action.status.value)
 
-            table.add_row(action.title, due_str, status_str)
+            rows.append((action.id, (action.title, due_str, status_str)))
 
-        if not self.action_ids:
-            table.add_row("[dim italic]No actions[/dim italic]", "", "")
+        self._sync_section(table, rows, "No actions")
 
     def refresh_agenda(self) -> None:
         """Refresh the agenda items section."""
+        self._render_agenda(self.db.get_agenda_items(self.subject_id))
+
+    def _render_agenda(self, items: list[AgendaItem]) -> None:
+        """Show the given agenda items in the agenda section."""
         table = self.query_one("#agenda-table", DataTable)
-        table.clear()
-        self.agenda_ids = []
 
-        items = self.db.get_agenda_items(self.subject_id)
+        self.agenda_by_id = {item.id: item for item in items}
+        self.agenda_ids = list(self.agenda_by_id)
 
+        rows = []
         for item in items:
-            # Skip archived items
-            if item.status.value == "archived":
-                continue
+            priority_str = _STARS[item.priority] if item.priority <= 5 else f"{_STARS[5]}+{item.priority-5}"
+            status_str = _AGENDA_STATUS_MARKUP.get(item.status.value, item.status.value)
 
-            self.agenda_ids.append(item.id)
+            rows.append((item.id, (item.title, priority_str, status_str)))
 
-            priority_str = "★" * item.priority if item.priority <= 5 else f"★★★★★+{item.priority-5}"
-
-            status_map = {
-                "active": "[yellow]ACTIVE[/yellow]",
-                "discussed": "[dim]DISCUSSED[/dim]",
-            }
-            status_str = status_map.get(item.status.value, item.status.value)
-
-            table.add_row(item.title, priority_str, status_str)
-
-        if not self.agenda_ids:
-            table.add_row("[dim italic]No agenda items[/dim italic]", "", "")
+        self._sync_section(table, rows, "No agenda items")
 
     def refresh_meetings(self) -> None:
         """Refresh the meetings section."""
-        table = self.query_one("#meetings-table", DataTable)
-        table.clear()
-        self.meeting_ids = []
+        self._render_meetings(self.db.get_meetings(self.subject_id))
 
-        meetings = self.db.get_meetings(self.subject_id)
+    def _render_meetings(self, meetings: list[Meeting]) -> None:
+        """Show the given meetings in the meetings section."""
+        table = self.query_one("#meetings-table", DataTable)
 
-        for meeting in meetings:
-            self.meeting_ids.append(meeting.id)
+        self.meetings_by_id = {meeting.id: meeting for meeting in meetings}
+        self.meeting_ids = list(self.meetings_by_id)
 
-            date_str = format_date_locale(meeting.date)
+        date_strs = format_dates_locale([meeting.date for meeting in meetings])
+        rows = []
+        for meeting, date_str in zip(meetings, date_strs):
             title = meeting.title or "Untitled"
             attendees_str = ", ".join(meeting.attendees[:3])
             if len(meeting.attendees) > 3:
                 attendees_str += f" +{len(meeting.attendees)-3} more"
 
-            table.add_row(date_str, title, attendees_str)
+            rows.append((meeting.id, (date_str, title, attendees_str)))
 
-        if not self.meeting_ids:
-            table.add_row("[dim italic]No meetings[/dim italic]", "", "")
+        self._sync_section(table, rows, "No meetings")
 
     def refresh_notes(self) -> None:
         """Refresh the notes section."""
-        table = self.query_one("#notes-table", DataTable)
-        table.clear()
-        self.note_ids = []
+        self._render_notes(self.db.get_notes(self.subject_id))
 
-        notes = self.db.get_notes(self.subject_id)
+    def _render_notes(self, notes: list[Note]) -> None:
+        """Show the given notes in the notes section."""
+        table = self.query_one("#notes-table", DataTable)
 
-        for note in notes:
-            self.note_ids.append(note.id)
+        self.notes_by_id = {note.id: note for note in notes}
+        self.note_ids = list(self.notes_by_id)
 
+        updated_strs = format_dates_locale([note.updated_at for note in notes], with_day_prefix=False)
+        rows = []
+        for note, updated_str in zip(notes, updated_strs):
             tags_str = ", ".join(note.tags[:3]) if note.tags else "-"
             if note.tags and len(note.tags) > 3:
                 tags_str += f" +{len(note.tags)-3}"
 
-            updated_str = format_date_locale(note.updated_at, with_day_prefix=False)
-
-            table.add_row(note.title, tags_str, updated_str)
+            rows.append((note.id, (note.title, tags_str, updated_str)))
 
-        if not self.note_ids:
-            table.add_row("[dim italic]No notes[/dim italic]", "", "")
+        self._sync_section(table, rows, "No notes")
 
     @work
     async def on_data_table_row_selected(self, event) -> None:
@@ -304,7 +320,7 @@ class SubjectDetailScreen(Screen):
 
         if table_id == "actions-table" and row_index < len(self.action_ids):
             action_id = self.action_ids[row_index]
-            action = self.db.get_action(action_id)
+            action = self.actions_by_id.get(action_id)
             if action:
                 result = await self.app.push_screen_wait(ViewActionDialog(action, self.subject_name))
                 if result:
@@ -314,7 +330,7 @@ class SubjectDetailScreen(Screen):
 
         elif table_id == "agenda-table" and row_index < len(self.agenda_ids):
             agenda_id = self.agenda_ids[row_index]
-            agenda_item = self.db.get_agenda_item(agenda_id)
+            agenda_item = self.agenda_by_id.get(agenda_id)
             if agenda_item:
                 result = await self.app.push_screen_wait(ViewAgendaDialog(agenda_item, self.subject_name))
                 if result:
@@ -324,7 +340,7 @@ class SubjectDetailScreen(Screen):
 
         elif table_id == "meetings-table" and row_index < len(self.meeting_ids):
             meeting_id = self.meeting_ids[row_index]
-            meeting = self.db.get_meeting(meeting_id)
+            meeting = self.meetings_by_id.get(meeting_id)
             if meeting:
                 result = await self.app.push_screen_wait(ViewMeetingDialog(meeting, self.subject_name, self.db))
                 if result:
@@ -334,7 +350,7 @@ class SubjectDetailScreen(Screen):
 
         elif table_id == "notes-table" and row_index < len(self.note_ids):
             note_id = self.note_ids[row_index]
-            note = self.db.get_note(note_id)
+            note = self.notes_by_id.get(note_id)
             if note:
                 result = await self.app.push_screen_wait(ViewNoteDialog(note, self.subject_name, self.db))
                 if result:
@@ -372,7 +388,7 @@ class SubjectDetailScreen(Screen):
         try:
             focused = self.app.focused
             if focused and focused.id == "subject-header":
-                subject = self.db.get_subject(self.subject_id)
+                subject = self._subject
                 if subject:
                     self.app.call_later(self._edit_subject, subject)
                 return
@@ -390,22 +406,22 @@ class SubjectDetailScreen(Screen):
 
         if table_id == "actions-table" and row_index < len(self.action_ids):
             action_id = self.action_ids[row_index]
-            action = self.db.get_action(action_id)
+            action = self.actions_by_id.get(action_id)
             if action:
                 self.app.call_later(self._edit_action, action)
         elif table_id == "agenda-table" and row_index < len(self.agenda_ids):
             agenda_id = self.agenda_ids[row_index]
-            agenda_item = self.db.get_agenda_item(agenda_id)
+            agenda_item = self.agenda_by_id.get(agenda_id)
             if agenda_item:
                 self.app.call_later(self._edit_agenda, agenda_item)
         elif table_id == "meetings-table" and row_index < len(self.meeting_ids):
             meeting_id = self.meeting_ids[row_index]
-            meeting = self.db.get_meeting(meeting_id)
+            meeting = self.meetings_by_id.get(meeting_id)
             if meeting:
                 self.app.call_later(self._edit_meeting, meeting)
         elif table_id == "notes-table" and row_index < len(self.note_ids):
             note_id = self.note_ids[row_index]
-            note = self.db.get_note(note_id)
+            note = self.notes_by_id.get(note_id)
             if note:
                 self.app.call_later(self._edit_note, note)
 
@@ -415,6 +431,7 @@ class SubjectDetailScreen(Screen):
         result = await self.app.push_screen_wait(EditSubjectDialog(subject))
         if result:
             self.db.update_subject(result)
+            self._subject = result
             self.load_subject_data()
             self.notify(f"Subject '{result.name}' updated")
 
@@ -513,22 +530,22 @@ class SubjectDetailScreen(Screen):
 
         if table_id == "actions-table" and table.cursor_row < len(self.action_ids):
             action_id = self.action_ids[table.cursor_row]
-            action = self.db.get_action(action_id)
+            action = self.actions_by_id.get(action_id)
             if action:
                 self.app.call_later(self._confirm_delete_action, action)
         elif table_id == "agenda-table" and table.cursor_row < len(self.agenda_ids):
             agenda_id = self.agenda_ids[table.cursor_row]
-            agenda_item = self.db.get_agenda_item(agenda_id)
+            agenda_item = self.agenda_by_id.get(agenda_id)
             if agenda_item:
                 self.app.call_later(self._confirm_delete_agenda, agenda_item)
         elif table_id == "meetings-table" and table.cursor_row < len(self.meeting_ids):
             meeting_id = self.meeting_ids[table.cursor_row]
-            meeting = self.db.get_meeting(meeting_id)
+            meeting = self.meetings_by_id.get(meeting_id)
             if meeting:
                 self.app.call_later(self._confirm_delete_meeting, meeting)
         elif table_id == "notes-table" and table.cursor_row < len(self.note_ids):
             note_id = self.note_ids[table.cursor_row]
-            note = self.db.get_note(note_id)
+            note = self.notes_by_id.get(note_id)
             if note:
                 self.app.call_later(self._confirm_delete_note, note)
 
@@ -6,7 +6,7 @@ This module will contain:
 - date_input.py: Custom date input widget with locale support
 """
 
-from .date_input import DateInput, format_date_locale
+from .date_input import DateInput, format_date_locale, format_dates_locale
 from .dialogs import (
     ConfirmDialog,
     EditSubjectDialog,
@@ -21,11 +21,13 @@ from .dialogs import (
     ViewMeetingDialog,
     ViewNoteDialog,
 )
+from .tables import sync_table_rows
 
 __all__ = [
     "ConfirmDialog",
     "DateInput",
     "format_date_locale",
+    "format_dates_locale",
     "EditSubjectDialog",
     "NewActionDialog",
     "NewAgendaDialog",
@@ -33,6 +35,7 @@ __all__ = [
     "NewNoteDialog",
     "NewSubjectDialog",
     "SubjectLookupDialog",
+    "sync_table_rows",
     "ViewActionDialog",
     "ViewAgendaDialog",
     "ViewMeetingDialog",
@@ -1,4 +1,6 @@
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterable
 import locale
 import re
 
@@ -9,22 +11,12 @@ from textual.widget import Widget
 from textual import events
 
 
-def format_date_locale(d: date | datetime | None, with_day_prefix: bool = True) -> str:
-    """Format a date with locale-aware format and optional day prefix.
-
-    Args:
-        d: The date to format (date or datetime)
-        with_day_prefix: Whether to include day name prefix (e.g., "Mon ")
+@lru_cache(maxsize=1)
+def _locale_date_format() -> str:
+    """Get the strftime pattern matching the locale's date order and separator.
 
-    Returns:
-        Formatted date string like "Mon 01/12/2024" or "01/12/2024"
+    Detected on first use only; the app does not change its locale while running.
     """
-    if d is None:
-        return "-"
-
-    if isinstance(d, datetime):
-        d = d.date()
-
     # Detect locale separator
     sample = date(2000, 11, 22).strftime('%x')
     separator = '/'
@@ -39,13 +31,28 @@ def format_date_locale(d: date | datetime | None, with_day_prefix: bool = True)
         day_pos = sample.find('22')
         month_pos = sample.find('11')
         if day_pos < month_pos:
-            date_format = f"%d{separator}%m{separator}%Y"
-        else:
-            date_format = f"%m{separator}%d{separator}%Y"
-    else:
-        date_format = f"%d{separator}%m{separator}%Y"
+            return f"%d{separator}%m{separator}%Y"
+        return f"%m{separator}%d{separator}%Y"
+    return f"%d{separator}%m{separator}%Y"
+
 
-    formatted = d.strftime(date_format)
+def format_date_locale(d: date | datetime | None, with_day_prefix: bool = True) -> str:
+    """Format a date with locale-aware format and optional day prefix.
+
+    Args:
+        d: The date to format (date or datetime)
+        with_day_prefix: Whether to include day name prefix (e.g., "Mon ")
+
+    Returns:
+        Formatted date string like "Mon 01/12/2024" or "01/12/2024"
+    """
+    if d is None:
+        return "-"
+
+    if isinstance(d, datetime):
+        d = d.date()
+
+    formatted = d.strftime(_locale_date_format())
 
     if with_day_prefix:
         day_name = d.strftime('%a')
@@ -54,6 +61,22 @@ def format_date_locale(d: date | datetime | None, with_day_prefix: bool = True)
     return formatted
 
 
+def format_dates_locale(dates: Iterable[date | datetime | None], with_day_prefix: bool = True) -> list[str]:
+    """Format several dates like format_date_locale, in one pass.
+
+    Args:
+        dates: The dates to format; None entries become "-"
+        with_day_prefix: Whether to include day name prefix (e.g., "Mon ")
+
+    Returns:
+        One formatted string per date, in the same order
+    """
+    date_format = _locale_date_format()
+    if with_day_prefix:
+        date_format = f"%a {date_format}"
+    return [d.strftime(date_format) if d is not None else "-" for d in dates]
+
+
 class DateInput(Widget, can_focus=True):
     """Custom date input with arrow key navigation and locale-aware formatting."""
 
@@ -8,7 +8,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Grid, Horizontal, Vertical, VerticalScroll, Container
 from textual.screen import ModalScreen
-from textual.widgets import Footer, Input, Label, Markdown, Select, TextArea
+from textual.widgets import DataTable, Footer, Input, Label, Markdown, Select, TextArea
 
 from ..models import Action, ActionStatus, Subject, SubjectType, Meeting, Note, AgendaItem, AgendaStatus
 from ..database import Database
@@ -123,8 +123,6 @@ class SubjectLookupDialog(ModalScreen[str | None]):
 
     def compose(self) -> ComposeResult:
         """Compose the dialog."""
-        from textual.widgets import DataTable
-
         container = Container(id="lookup-container")
         container.border_title = "Find Subject"
         with container:
@@ -148,8 +146,6 @@ class SubjectLookupDialog(ModalScreen[str | None]):
 
     def _refresh_results(self, query: str) -> None:
         """Refresh the results table based on search query."""
-        from textual.widgets import DataTable
-
         table = self.query_one("#results-table", DataTable)
         no_results_label = self.query_one("#no-results", Label)
         table.clear()
@@ -220,8 +216,6 @@ class SubjectLookupDialog(ModalScreen[str | None]):
 
     def action_select(self) -> None:
         """Select the current subject and close."""
-        from textual.widgets import DataTable
-
         table = self.query_one("#results-table", DataTable)
         if table.cursor_row is not None and table.cursor_row < len(self.subject_ids):
             subject_id = self.subject_ids[table.cursor_row]
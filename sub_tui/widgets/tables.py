@@ -0,0 +1,36 @@
+"""Helpers for keeping DataTable contents in step with query results."""
+
+from textual.widgets import DataTable
+
+
+def sync_table_rows(table: DataTable, rows: list[tuple[str, tuple]]) -> None:
+    """Make a table show the given (key, cells) rows, in order.
+
+    Only the differences are applied: rows whose key is gone are removed,
+    changed cells are updated in place and new rows are appended. Rows that
+    stay keep their rendered cache and the cursor stays put. When the new
+    order cannot be reached that way the table is refilled instead. The
+    whole sync runs inside one app batch update, so the screen is repainted
+    once rather than after each row.
+    """
+    # Hold screen updates until every row change has been applied
+    with table.app.batch_update():
+        wanted = {key for key, _ in rows}
+        kept = [row.key.value for row in table.ordered_rows if row.key.value in wanted]
+        if [key for key, _ in rows[:len(kept)]] != kept:
+            table.clear()
+            for key, cells in rows:
+                table.add_row(*cells, key=key)
+            return
+
+        for row in list(table.ordered_rows):
+            if row.key.value not in wanted:
+                table.remove_row(row.key)
+
+        columns = [column.key for column in table.ordered_columns]
+        for key, cells in rows[:len(kept)]:
+            for column, old, new in zip(columns, table.get_row(key), cells):
+                if old != new:
+                    table.update_cell(key, column, new, update_width=True)
+        for key, cells in rows[len(kept):]:
+            table.add_row(*cells, key=key)
@@ -1,5 +1,6 @@
 """Tests for SubTUI database operations."""
 
+import sqlite3
 from datetime import datetime, timedelta
 
 import pytest
@@ -75,6 +76,23 @@ class TestSubjectCRUD:
         result = db.get_subject(sample_subject.id)
         assert result is None
 
+    def test_get_subject_bundle(self, populated_db, sample_subject, sample_action,
+                                sample_meeting, sample_note, sample_agenda_item):
+        """Test getting a subject together with its detail screen items."""
+        bundle = populated_db.get_subject_bundle(sample_subject.id)
+
+        assert bundle.subject.name == sample_subject.name
+        assert [a.id for a in bundle.actions] == [sample_action.id]
+        assert [i.id for i in bundle.agenda_items] == [sample_agenda_item.id]
+        assert [m.id for m in bundle.meetings] == [sample_meeting.id]
+        assert [n.id for n in bundle.notes] == [sample_note.id]
+        assert not populated_db.conn.in_transaction
+
+    def test_get_subject_bundle_nonexistent(self, db):
+        """Test getting the bundle of a subject that doesn't exist."""
+        assert db.get_subject_bundle("nonexistent-id") is None
+        assert not db.conn.in_transaction
+
 
 class TestCascadeDelete:
     """Tests for cascade delete on subject deletion."""
@@ -132,6 +150,60 @@ class TestCascadeDelete:
         assert len(items) == 0
 
 
+    def test_delete_subject_clears_search_index(self, populated_db, sample_subject):
+        """Test that cascaded deletes also remove child rows from search."""
+        populated_db.delete_subject(sample_subject.id)
+
+        assert populated_db.search("Test") == []
+
+    def test_legacy_schema_is_migrated_to_cascade(self, tmp_path, sample_subject):
+        """Test that tables created without ON DELETE CASCADE are rebuilt with it."""
+        path = tmp_path / "index.db"
+        legacy = sqlite3.connect(path)
+        legacy.executescript("""
+            CREATE TABLE subjects (
+                id TEXT PRIMARY KEY, name TEXT NOT NULL, code TEXT, type TEXT NOT NULL,
+                description TEXT, created_at TEXT NOT NULL, last_reviewed_at TEXT NOT NULL
+            );
+            CREATE TABLE actions (
+                id TEXT PRIMARY KEY, subject_id TEXT NOT NULL, title TEXT NOT NULL,
+                description TEXT, status TEXT NOT NULL, due_date TEXT, created_at TEXT NOT NULL,
+                completed_at TEXT, archived_at TEXT, meeting_id TEXT, agenda_item_id TEXT, tags TEXT,
+                FOREIGN KEY (subject_id) REFERENCES subjects(id)
+            );
+            INSERT INTO subjects VALUES ('test-sub', 'Test Project', 'TST', 'project', NULL,
+                                         '2024-01-01T12:00:00', '2024-01-15T12:00:00');
+            INSERT INTO actions VALUES ('old-act', 'test-sub', 'Legacy action', NULL, 'todo', NULL,
+                                        '2024-01-02T12:00:00', NULL, NULL, NULL, NULL, NULL);
+        """)
+        legacy.close()
+
+        database = Database(str(path))
+        try:
+            fk = database.conn.execute("PRAGMA foreign_key_list(actions)").fetchone()
+            assert fk["on_delete"] == "CASCADE"
+            assert database.get_action("old-act").title == "Legacy action"
+
+            database.delete_subject(sample_subject.id)
+            assert database.get_action("old-act") is None
+        finally:
+            database.close()
+
+    def test_migrations_are_skipped_once_applied(self, tmp_path):
+        """Test that user_version records applied migrations."""
+        path = str(tmp_path / "index.db")
+        Database(path).close()
+
+        database = Database(path)
+        statements = []
+        try:
+            database.conn.set_trace_callback(statements.append)
+            database._run_migrations()
+        finally:
+            database.close()
+
+        assert statements == ["PRAGMA user_version"]
+
 class TestActionCRUD:
     """Tests for Action CRUD operations."""
 
@@ -156,6 +228,44 @@ class TestActionCRUD:
         assert len(actions) == 1
         assert actions[0].id == sample_action.id
 
+    def test_get_actions_skips_archived(self, db, sample_subject, sample_action):
+        """Test that archived actions are only returned when asked for."""
+        db.add_subject(sample_subject)
+        sample_action.archived_at = datetime.now()
+        db.add_action(sample_action)
+
+        assert db.get_actions(sample_subject.id) == []
+        assert [a.id for a in db.get_actions(sample_subject.id, include_archived=True)] == [sample_action.id]
+        assert list(db.iter_actions(sample_subject.id)) == []
+        assert [a.id for a in db.iter_actions(sample_subject.id, include_archived=True)] == [sample_action.id]
+
+    def test_iter_actions_streams_rows(self, db, sample_subject, sample_action):
+        """Test that iter_actions yields actions lazily."""
+        db.add_subject(sample_subject)
+        db.add_action(sample_action)
+
+        actions = db.iter_actions(sample_subject.id)
+
+        assert next(actions).id == sample_action.id
+        assert next(actions, None) is None
+
+    def test_getters_do_not_disturb_open_iterator(self, db, sample_subject, sample_action):
+        """Test that list getters sharing a cursor leave iter_* generators intact."""
+        db.add_subject(sample_subject)
+        db.add_many_actions([
+            Action(id=f"act-{i}", subject_id=sample_subject.id, title=f"Action {i}", status=ActionStatus.TODO,
+                   created_at=sample_action.created_at)
+            for i in range(3)
+        ])
+
+        seen = []
+        for action in db.iter_actions(sample_subject.id):
+            assert db.get_action(action.id).id == action.id
+            assert len(db.get_actions(sample_subject.id)) == 3
+            seen.append(action.id)
+
+        assert sorted(seen) == ["act-0", "act-1", "act-2"]
+
     def test_update_action(self, db, sample_subject, sample_action):
         """Test updating an action."""
         db.add_subject(sample_subject)
@@ -179,6 +289,40 @@ class TestActionCRUD:
         result = db.get_action(sample_action.id)
         assert result is None
 
+    def test_get_action_counts_by_subject(self, db, sample_subject, sample_action):
+        """Test counting actions per subject, with and without archived ones."""
+        db.add_subject(sample_subject)
+        db.add_action(sample_action)
+        sample_action.id = "archived-act"
+        sample_action.archived_at = datetime(2024, 1, 20)
+        db.add_action(sample_action)
+
+        assert db.get_action_counts_by_subject() == {sample_subject.id: 1}
+        assert db.get_action_counts_by_subject(include_archived=True) == {sample_subject.id: 2}
+
+    def test_get_actions_by_tag(self, db, sample_subject, sample_action):
+        """Test looking up actions by tag, ignoring case."""
+        db.add_subject(sample_subject)
+        db.add_action(sample_action)
+
+        assert [a.id for a in db.get_actions_by_tag("TEST")] == [sample_action.id]
+        assert db.get_actions_by_tag("tes") == []
+
+    def test_update_and_delete_action_reindex_tags(self, db, sample_subject, sample_action):
+        """Test that tag rows follow action updates and deletes."""
+        db.add_subject(sample_subject)
+        db.add_action(sample_action)
+
+        sample_action.tags = ["renamed"]
+        db.update_action(sample_action)
+
+        assert db.get_actions_by_tag("test") == []
+        assert [a.id for a in db.get_actions_by_tag("renamed")] == [sample_action.id]
+
+        db.delete_subject(sample_subject.id)
+
+        assert db.conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 0
+
 
 class TestMeetingCRUD:
     """Tests for Meeting CRUD operations."""
@@ -227,6 +371,76 @@ class TestMeetingCRUD:
         result = db.get_meeting(sample_meeting.id)
         assert result is None
 
+    def test_get_meetings_by_attendee(self, db, sample_subject, sample_meeting):
+        """Test looking up meetings by attendee, ignoring case."""
+        db.add_subject(sample_subject)
+        db.add_meeting(sample_meeting)
+
+        assert [m.id for m in db.get_meetings_by_attendee("alice")] == [sample_meeting.id]
+        assert db.get_meetings_by_attendee("Charlie") == []
+
+    def test_update_meeting_reindexes_attendees(self, db, sample_subject, sample_meeting):
+        """Test that changing attendees updates the attendee lookup."""
+        db.add_subject(sample_subject)
+        db.add_meeting(sample_meeting)
+
+        sample_meeting.attendees = ["Charlie"]
+        db.update_meeting(sample_meeting)
+
+        assert db.get_meetings_by_attendee("Alice") == []
+        assert [m.id for m in db.get_meetings_by_attendee("Charlie")] == [sample_meeting.id]
+        assert db.get_meeting(sample_meeting.id).attendees == ["Charlie"]
+
+    def test_attendee_name_starting_with_bracket(self, db, sample_subject, sample_meeting):
+        """Test that an attendee name starting with "[" round-trips."""
+        db.add_subject(sample_subject)
+        sample_meeting.attendees = ["[ext] Bob", "Alice"]
+        db.add_meeting(sample_meeting)
+
+        assert db.get_meeting(sample_meeting.id).attendees == ["[ext] Bob", "Alice"]
+        assert db.get_meetings(sample_subject.id)[0].attendees == ["[ext] Bob", "Alice"]
+        assert db.get_subject_bundle(sample_subject.id).meetings[0].attendees == ["[ext] Bob", "Alice"]
+
+    def test_bracketed_attendees_survive_migration(self, tmp_path, sample_subject, sample_meeting):
+        """Test that the JSON attendee migration leaves comma-separated text alone."""
+        path = str(tmp_path / "index.db")
+        database = Database(path)
+        database.add_subject(sample_subject)
+        sample_meeting.attendees = ["[ext] Bob", "Alice"]
+        database.add_meeting(sample_meeting)
+        database.conn.execute("PRAGMA user_version = 3")
+        database.close()
+
+        database = Database(path)
+        try:
+            attendees = database.get_meeting(sample_meeting.id).attendees
+        finally:
+            database.close()
+
+        assert attendees == ["[ext] Bob", "Alice"]
+
+    def test_json_attendees_are_migrated(self, tmp_path, sample_subject, sample_meeting):
+        """Test that attendee lists stored as JSON are converted and indexed."""
+        path = str(tmp_path / "index.db")
+        database = Database(path)
+        database.add_subject(sample_subject)
+        database.add_meeting(sample_meeting)
+        database.conn.execute("DELETE FROM meeting_attendees")
+        database.conn.execute("UPDATE meetings SET attendees = '[\"Alice\", \"Bob\"]'")
+        database.conn.execute("PRAGMA user_version = 3")
+        database.conn.commit()
+        database.close()
+
+        database = Database(path)
+        try:
+            stored = database.conn.execute("SELECT attendees FROM meetings").fetchone()[0]
+            by_attendee = database.get_meetings_by_attendee("Bob")
+        finally:
+            database.close()
+
+        assert stored == "Alice, Bob"
+        assert [m.id for m in by_attendee] == [sample_meeting.id]
+
 
 class TestNoteCRUD:
     """Tests for Note CRUD operations."""
@@ -273,6 +487,36 @@ class TestNoteCRUD:
         result = db.get_note(sample_note.id)
         assert result is None
 
+    def test_get_notes_by_tag(self, db, sample_subject, sample_note):
+        """Test looking up notes by tag after an update."""
+        db.add_subject(sample_subject)
+        db.add_note(sample_note)
+
+        sample_note.tags = ["reference", "howto"]
+        db.update_note(sample_note)
+
+        assert [n.id for n in db.get_notes_by_tag("howto")] == [sample_note.id]
+        assert db.get_notes_by_tag("documentation") == []
+
+    def test_tags_are_backfilled(self, tmp_path, sample_subject, sample_note):
+        """Test that tags stored only in the tags column are indexed on open."""
+        path = str(tmp_path / "tags.db")
+        database = Database(path)
+        database.add_subject(sample_subject)
+        database.add_note(sample_note)
+        database.conn.execute("DELETE FROM tags")
+        database.conn.execute("PRAGMA user_version = 4")
+        database.conn.commit()
+        database.close()
+
+        database = Database(path)
+        try:
+            by_tag = database.get_notes_by_tag("reference")
+        finally:
+            database.close()
+
+        assert [n.id for n in by_tag] == [sample_note.id]
+
 
 class TestAgendaItemCRUD:
     """Tests for AgendaItem CRUD operations."""
@@ -288,6 +532,16 @@ class TestAgendaItemCRUD:
         assert retrieved.id == sample_agenda_item.id
         assert retrieved.title == sample_agenda_item.title
 
+    def test_get_active_agenda_counts_by_subject(self, db, sample_subject, sample_agenda_item):
+        """Test counting active agenda items per subject."""
+        db.add_subject(sample_subject)
+        db.add_agenda_item(sample_agenda_item)
+        sample_agenda_item.id = "discussed-agn"
+        sample_agenda_item.status = AgendaStatus.DISCUSSED
+        db.add_agenda_item(sample_agenda_item)
+
+        assert db.get_active_agenda_counts_by_subject() == {sample_subject.id: 1}
+
     def test_get_agenda_items_for_subject(self, db, sample_subject, sample_agenda_item):
         """Test getting all agenda items for a subject."""
         db.add_subject(sample_subject)
@@ -298,6 +552,19 @@ class TestAgendaItemCRUD:
         assert len(items) == 1
         assert items[0].id == sample_agenda_item.id
 
+    def test_get_agenda_items_skips_archived(self, db, sample_subject, sample_agenda_item):
+        """Test that archived agenda items are only returned when asked for."""
+        db.add_subject(sample_subject)
+        sample_agenda_item.status = AgendaStatus.ARCHIVED
+        db.add_agenda_item(sample_agenda_item)
+
+        assert db.get_agenda_items(sample_subject.id) == []
+        items = db.get_agenda_items(sample_subject.id, include_archived=True)
+        assert [i.id for i in items] == [sample_agenda_item.id]
+        assert list(db.iter_agenda_items(sample_subject.id)) == []
+        items = db.iter_agenda_items(sample_subject.id, include_archived=True)
+        assert [i.id for i in items] == [sample_agenda_item.id]
+
     def test_update_agenda_item(self, db, sample_subject, sample_agenda_item):
         """Test updating an agenda item."""
         db.add_subject(sample_subject)
@@ -346,6 +613,52 @@ class TestActionsByTimeframe:
         assert len(results) == 1
         assert results[0]["id"] == "act-today"
 
+    def test_timeframe_day_boundaries(self, db, sample_subject):
+        """Test that week and next_week cover whole calendar days."""
+        db.add_subject(sample_subject)
+
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        due_offsets = {
+            "act-d0": timedelta(0),
+            "act-d7": timedelta(days=7, hours=23),
+            "act-d8": timedelta(days=8),
+            "act-d14": timedelta(days=14, hours=23),
+            "act-d15": timedelta(days=15),
+        }
+        db.add_many_actions([
+            Action(id=action_id, subject_id=sample_subject.id, title=action_id,
+                   status=ActionStatus.TODO, created_at=today, due_date=today + offset)
+            for action_id, offset in due_offsets.items()
+        ])
+
+        def ids(timeframe):
+            return [r["id"] for r in db.get_actions_by_timeframe(timeframe)]
+
+        assert ids("today") == ["act-d0"]
+        assert ids("week") == ["act-d0", "act-d7"]
+        assert ids("next_week") == ["act-d8", "act-d14"]
+
+    def test_actions_flag_overdue(self, db, sample_subject):
+        """Test that unfinished actions due before today are flagged overdue."""
+        db.add_subject(sample_subject)
+
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        db.add_many_actions([
+            Action(id="late", subject_id=sample_subject.id, title="Late", status=ActionStatus.TODO,
+                   created_at=today, due_date=today - timedelta(minutes=1)),
+            Action(id="late-done", subject_id=sample_subject.id, title="Late but done",
+                   status=ActionStatus.DONE, created_at=today, due_date=today - timedelta(days=1),
+                   completed_at=today),
+            Action(id="today", subject_id=sample_subject.id, title="Due today", status=ActionStatus.TODO,
+                   created_at=today, due_date=today),
+            Action(id="undated", subject_id=sample_subject.id, title="No due date",
+                   status=ActionStatus.TODO, created_at=today),
+        ])
+
+        overdue = {r["id"]: bool(r["overdue"]) for r in db.get_actions_by_timeframe("all")}
+
+        assert overdue == {"late": True, "late-done": False, "today": False, "undated": False}
+
     def test_actions_all_excludes_old_done(self, db, sample_subject):
         """Test that 'all' filter excludes old completed actions."""
         db.add_subject(sample_subject)
@@ -367,6 +680,25 @@ class TestActionsByTimeframe:
         # Should not include old completed action
         assert all(r["id"] != "act-old-done" for r in results)
 
+    def test_actions_all_excludes_archived_recently_done(self, db, sample_subject):
+        """Test that 'all' does not let recently completed actions bypass the archive filter."""
+        db.add_subject(sample_subject)
+
+        now = datetime.now()
+        db.add_action(Action(
+            id="act-archived",
+            subject_id=sample_subject.id,
+            title="Archived Action",
+            status=ActionStatus.DONE,
+            created_at=now,
+            completed_at=now,
+            archived_at=now,
+            tags=[],
+        ))
+
+        assert db.get_actions_by_timeframe("all") == []
+        assert [r["id"] for r in db.get_actions_by_timeframe("all", include_archived=True)] == ["act-archived"]
+
 
 class TestSearch:
     """Tests for unified full-text search."""
@@ -392,6 +724,21 @@ class TestSearch:
         assert len(results) > 0
         assert any(r["content_type"] == "note" for r in results)
 
+    def test_search_ranks_title_matches_first(self, db, sample_subject):
+        """Test that a title match outranks repeated matches in body text."""
+        db.add_subject(sample_subject)
+        now = datetime.now()
+        db.add_many_notes([
+            Note(id="body", subject_id=sample_subject.id, title="Cluster notes",
+                 content="kubernetes kubernetes kubernetes", tags=[], created_at=now, updated_at=now),
+            Note(id="title", subject_id=sample_subject.id, title="Kubernetes upgrade",
+                 content="Plan the rollout", tags=[], created_at=now, updated_at=now),
+        ])
+
+        results = db.search("kubernetes")
+
+        assert [r["content_id"] for r in results] == ["title", "body"]
+
     def test_search_all_types(self, populated_db):
         """Test searching across all content types."""
         results = populated_db.search("Test")
@@ -401,6 +748,57 @@ class TestSearch:
         types_found = set(r["content_type"] for r in results)
         assert len(types_found) >= 1
 
+    def test_search_ignores_diacritics(self, db, sample_subject):
+        """Test that accented and unaccented spellings match each other."""
+        sample_subject.description = "Café rénovation"
+        db.add_subject(sample_subject)
+
+        assert db.search("cafe renovation", content_types=["subject"])
+
+    def test_update_replaces_search_entry(self, populated_db, sample_note):
+        """Test that an edit rewrites the entity's existing FTS row in place."""
+        rows_before = populated_db.conn.execute("SELECT count(*) FROM unified_fts").fetchone()[0]
+
+        sample_note.title = "Renamed Reference"
+        sample_note.content = "Rewritten body"
+        populated_db.update_note(sample_note)
+
+        rows_after = populated_db.conn.execute("SELECT count(*) FROM unified_fts").fetchone()[0]
+        mapped = populated_db.conn.execute("SELECT count(*) FROM fts_map").fetchone()[0]
+        assert rows_after == rows_before == mapped
+        assert populated_db.search("Knowledge", content_types=["note"]) == []
+        assert [r["title"] for r in populated_db.search("Rewritten")] == ["Renamed Reference"]
+
+    def test_rebuild_search_index(self, populated_db):
+        """Test that the index can be repopulated from the base tables."""
+        populated_db.conn.execute("DELETE FROM unified_fts")
+        assert populated_db.search("Knowledge Note") == []
+
+        populated_db.rebuild_search_index()
+
+        assert populated_db.search("Knowledge Note", content_types=["note"])
+
+    def test_outdated_search_schema_is_rebuilt(self, tmp_path, sample_subject):
+        """Test that an FTS table with an old definition is recreated and refilled."""
+        path = str(tmp_path / "index.db")
+        database = Database(path)
+        database.add_subject(sample_subject)
+        database.conn.executescript("""
+            DROP TABLE unified_fts;
+            CREATE VIRTUAL TABLE unified_fts USING fts5(
+                content_type, content_id, subject_id, subject_name, title, searchable_text
+            );
+        """)
+        database.close()
+
+        database = Database(path)
+        try:
+            results = database.search("Test Project", content_types=["subject"])
+        finally:
+            database.close()
+
+        assert [r["content_id"] for r in results] == [sample_subject.id]
+
 
 class TestActionsByContent:
     """Tests for getting actions linked to meetings/notes."""
@@ -446,3 +844,224 @@ class TestActionsByContent:
 
         assert len(results) == 1
         assert results[0].id == "act-from-note"
+
+
+class TestBulkInsert:
+    """Tests for the add_many_* bulk insert methods."""
+
+    def test_add_many_subjects(self, db):
+        """Test adding several subjects at once."""
+        now = datetime.now()
+        subjects = [
+            Subject(id=f"sub-{i}", name=f"Subject {i}", type=SubjectType.TEAM,
+                    created_at=now, last_reviewed_at=now)
+            for i in range(5)
+        ]
+        db.add_many_subjects(subjects)
+
+        assert len(db.get_all_subjects()) == 5
+
+    def test_add_many_actions(self, db, sample_subject):
+        """Test adding several actions at once."""
+        db.add_subject(sample_subject)
+        actions = [
+            Action(id=f"act-{i}", subject_id=sample_subject.id, title=f"Action {i}",
+                   status=ActionStatus.TODO, created_at=datetime.now(), tags=["bulk"])
+            for i in range(5)
+        ]
+        db.add_many_actions(actions)
+
+        retrieved = db.get_actions(sample_subject.id)
+        assert len(retrieved) == 5
+        assert all(a.tags == ["bulk"] for a in retrieved)
+
+    def test_add_many_agenda_items(self, db, sample_subject):
+        """Test adding several agenda items at once."""
+        db.add_subject(sample_subject)
+        items = [
+            AgendaItem(id=f"agn-{i}", subject_id=sample_subject.id, title=f"Item {i}",
+                       priority=i, status=AgendaStatus.ACTIVE, created_at=datetime.now())
+            for i in range(1, 4)
+        ]
+        db.add_many_agenda_items(items)
+
+        assert len(db.get_agenda_items(sample_subject.id)) == 3
+
+    def test_add_many_meetings_and_notes(self, db, sample_subject, sample_meeting, sample_note):
+        """Test adding several meetings and notes at once."""
+        db.add_subject(sample_subject)
+        db.add_many_meetings([sample_meeting])
+        db.add_many_notes([sample_note])
+
+        assert [m.id for m in db.get_meetings(sample_subject.id)] == [sample_meeting.id]
+        assert [n.id for n in db.get_notes(sample_subject.id)] == [sample_note.id]
+
+    def test_add_many_spans_several_statements(self, db, sample_subject):
+        """Test a batch larger than one multi-row INSERT can hold."""
+        db.add_subject(sample_subject)
+        actions = [
+            Action(id=f"act-{i}", subject_id=sample_subject.id, title=f"Action {i}",
+                   status=ActionStatus.TODO, created_at=datetime.now())
+            for i in range(200)
+        ]
+        db.add_many_actions(actions)
+
+        assert len(db.get_actions(sample_subject.id)) == 200
+
+    def test_add_many_empty(self, db):
+        """Test that an empty batch is a no-op."""
+        db.add_many_subjects([])
+
+        assert db.get_all_subjects() == []
+
+    def test_add_many_is_searchable(self, db, sample_subject):
+        """Test that bulk inserted rows are indexed for search."""
+        db.add_subject(sample_subject)
+        db.add_many_actions([
+            Action(id="act-bulk", subject_id=sample_subject.id, title="Quarterly budget",
+                   status=ActionStatus.TODO, created_at=datetime.now()),
+        ])
+
+        results = db.search("budget", content_types=["action"])
+        assert [r["content_id"] for r in results] == ["act-bulk"]
+
+    def test_bulk_load_rebuilds_indexes(self, db, sample_subject):
+        """Test that bulk_load drops secondary indexes and restores them on exit."""
+        def index_names():
+            rows = db.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            ).fetchall()
+            return {row[0] for row in rows}
+
+        before = index_names()
+        with db.bulk_load():
+            assert index_names() == set()
+            db.add_subject(sample_subject)
+
+        assert index_names() == before
+        assert db.get_subject(sample_subject.id) is not None
+
+    def test_bulk_load_indexes_search_once(self, db, sample_subject, sample_note):
+        """Test that rows loaded in bulk are searchable and triggers are restored."""
+        with db.bulk_load():
+            db.add_subject(sample_subject)
+            db.add_many_notes([sample_note])
+            assert db.search("Knowledge Note") == []
+
+        assert db.search("Knowledge Note", content_types=["note"])
+
+        sample_note.title = "Renamed Reference"
+        db.update_note(sample_note)
+        assert db.search("Renamed", content_types=["note"])
+
+
+class TestTransaction:
+    """Tests for grouping writes into one commit."""
+
+    def test_transaction_commits_on_exit(self, db, sample_subject, sample_action):
+        """Test that writes inside a transaction are committed together."""
+        with db.transaction():
+            db.add_subject(sample_subject)
+            db.add_action(sample_action)
+            assert db.conn.in_transaction
+
+        assert not db.conn.in_transaction
+        assert db.get_action(sample_action.id) is not None
+
+    def test_transaction_rolls_back_on_error(self, db, sample_subject, sample_action):
+        """Test that an exception discards everything written in the transaction."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_subject(sample_subject)
+                db.add_action(sample_action)
+                raise RuntimeError("boom")
+
+        assert db.get_all_subjects() == []
+        assert db.get_action(sample_action.id) is None
+
+    def test_nested_transaction_rolls_back_outer(self, db, sample_subject, sample_action):
+        """Test that an error in a nested transaction discards the outer writes too."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_subject(sample_subject)
+                with db.transaction():
+                    db.add_action(sample_action)
+                raise RuntimeError("boom")
+
+        assert db.get_subject(sample_subject.id) is None
+        assert db.get_action(sample_action.id) is None
+
+    def test_transaction_joins_callers_transaction(self, db, sample_subject, sample_action):
+        """Test that transaction() leaves a transaction it did not open to the caller."""
+        db.conn.execute("BEGIN")
+        with db.transaction():
+            db.add_subject(sample_subject)
+        assert db.conn.in_transaction
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_action(sample_action)
+                raise RuntimeError("boom")
+        assert db.conn.in_transaction
+
+        db.conn.rollback()
+        assert db.get_subject(sample_subject.id) is None
+        assert db.get_action(sample_action.id) is None
+
+    def test_single_write_commits_immediately(self, tmp_path, sample_subject):
+        """Test that a write outside transaction() is visible to other connections."""
+        path = str(tmp_path / "index.db")
+        database = Database(path)
+        try:
+            database.add_subject(sample_subject)
+            assert not database.conn.in_transaction
+
+            other = sqlite3.connect(path)
+            count = other.execute("SELECT COUNT(*) FROM subjects").fetchone()[0]
+            other.close()
+        finally:
+            database.close()
+
+        assert count == 1
+
+
+class TestConnectionSettings:
+    """Tests for connection pragmas and query plans."""
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test that on-disk databases are opened in WAL mode."""
+        database = Database(str(tmp_path / "index.db"))
+        try:
+            mode = database.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            sync = database.conn.execute("PRAGMA synchronous").fetchone()[0]
+        finally:
+            database.close()
+
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+
+    def test_total_changes_tracks_writes(self, db, sample_subject):
+        """Test that total_changes moves on writes but not on reads."""
+        before = db.total_changes
+        db.get_all_subjects()
+        assert db.total_changes == before
+
+        db.add_subject(sample_subject)
+        assert db.total_changes > before
+
+    def test_connection_pragmas(self, db):
+        """Test that per-connection pragmas are applied."""
+        assert db.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert db.conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert db.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_subject_lists_skip_sorting(self, db, sample_subject):
+        """Test that per-subject list queries read rows in index order."""
+        for table, order in (("agenda_items", "priority DESC"), ("meetings", "date DESC"),
+                             ("actions", "due_date ASC"), ("notes", "updated_at DESC")):
+            plan = db.conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE subject_id = ? ORDER BY {order}",
+                (sample_subject.id,)
+            ).fetchall()
+
+            assert not any("TEMP B-TREE" in row[3] for row in plan)
@@ -60,6 +60,13 @@ class TestSubject:
         assert subject.code is None
         assert subject.description is None
 
+    def test_from_row(self, sample_subject):
+        """Test Subject construction from a positional database row."""
+        row = ("test-sub", "Test Project", "TST", "project", "A test project",
+               "2024-01-01T12:00:00", "2024-01-15T12:00:00")
+
+        assert Subject.from_row(row) == sample_subject
+
     def test_subject_types(self):
         """Test all SubjectType values."""
         assert SubjectType.BOARD.value == "board"
@@ -118,6 +125,18 @@ class TestAction:
 
         assert action.tags == []
 
+    def test_from_row(self):
+        """Test Action construction from a positional database row."""
+        row = ("act-row", "sub-1", "Row action", None, "done", "2024-01-10T00:00:00",
+               "2024-01-01T00:00:00", "2024-01-09T00:00:00", None, None, None, None, "a, b")
+        action = Action.from_row(row)
+
+        assert action.status == ActionStatus.DONE
+        assert action.due_date == datetime(2024, 1, 10)
+        assert action.completed_at == datetime(2024, 1, 9)
+        assert action.archived_at is None
+        assert action.tags == ["a", "b"]
+
     def test_action_statuses(self):
         """Test all ActionStatus values."""
         assert ActionStatus.TODO.value == "todo"
@@ -161,6 +180,13 @@ class TestMeeting:
 
         assert meeting.title == "Meeting"
 
+    def test_from_row_splits_attendees_on_commas(self):
+        """Test that a leading "[" in an attendee name is kept as text."""
+        row = ("test-mtg", "test-sub", "Test Meeting", "2024-01-05T10:00:00", "[ext] Bob, Alice",
+               "Notes", "2024-01-05T10:00:00", "2024-01-05T11:00:00")
+
+        assert Meeting.from_row(row).attendees == ["[ext] Bob", "Alice"]
+
 
 class TestNote:
     """Tests for Note model."""